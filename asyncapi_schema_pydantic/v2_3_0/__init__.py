@@ -5,12 +5,32 @@ https://github.com/asyncapi/spec/blob/master/spec/asyncapi.md
 
 from .async_api import AsyncAPI
 from .async_api_base import AsyncAPIBase
+from .base_model import AsyncAPIModel, SubtreeMemo, interning, validating_protocols
+from .bindings import BindingsModel
+from .file_cache import FileCache
+from .loaders import DocumentLoaders, document_loaders
+from .bulk import LoadResult, LoadError
+from .reload import ReloadableDocument
+from .registry import SpecRegistry
+from .ref_resolver import RefResolver, RefResolutionError, RefCycleError, RefBudgetExceededError, ResolutionLimits
+from .snapshot_cache import SnapshotCache
+from .dereference import dereference, build_pointer_index
+from .selection import select_channels
+from .lazy import LazyReference, LazyModelDict
 from .info import Info
 from .contact import Contact
 from .license import License
 from .server import Server
 from .server_variable import ServerVariable
 from .channel import ChannelItem
+from .channel_uri import (
+    ChannelUri,
+    ChannelUriError,
+    ChannelTemplate,
+    ChannelExpression,
+    ChannelVariable,
+    parse_channel_uri,
+)
 from .operation import Operation
 from .operation import OperationTrait
 from .message import Message
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class Amqp1ChannelBinding(BaseModel):
+
+class Amqp1ChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe AMQP 1.0-specific information on AsyncAPI.
 
@@ -12,7 +14,7 @@ class Amqp1ChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class Amqp1MessageBinding(BaseModel):
+class Amqp1MessageBinding(AsyncAPIModel):
     """
     This document defines how to describe AMQP 1.0-specific information on AsyncAPI.
 
@@ -23,7 +25,7 @@ class Amqp1MessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class Amqp1OperationBinding(BaseModel):
+class Amqp1OperationBinding(AsyncAPIModel):
     """
     This document defines how to describe AMQP 1.0-specific information on AsyncAPI.
 
@@ -34,7 +36,7 @@ class Amqp1OperationBinding(BaseModel):
         extra = Extra.forbid
 
 
-class Amqp1ServerBinding(BaseModel):
+class Amqp1ServerBinding(AsyncAPIModel):
     """
     This document defines how to describe AMQP 1.0-specific information on AsyncAPI.
 
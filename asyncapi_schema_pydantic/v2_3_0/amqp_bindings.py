@@ -1,6 +1,8 @@
 from typing import List, Optional
 from enum import Enum
-from pydantic import BaseModel, Field, Extra
+from pydantic import Field, Extra
+
+from .base_model import AsyncAPIModel
 
 
 class AmqpChannelType(str, Enum):
@@ -16,7 +18,7 @@ class AmqpExchangeType(str, Enum):
     default = 'default'
 
 
-class AmqpExchange(BaseModel):
+class AmqpExchange(AsyncAPIModel):
     """
     This object defines AMQP exchange properties.
     """
@@ -48,7 +50,7 @@ class AmqpExchange(BaseModel):
     """
 
 
-class AmqpQueue(BaseModel):
+class AmqpQueue(AsyncAPIModel):
     """
     This object defines AMQP queue properties.
     """
@@ -79,7 +81,7 @@ class AmqpQueue(BaseModel):
     """
 
 
-class AmqpChannelBinding(BaseModel):
+class AmqpChannelBinding(AsyncAPIModel):
     """
     This object contains information about the channel representation in AMQP.
     """
@@ -105,7 +107,7 @@ class AmqpChannelBinding(BaseModel):
     """
 
 
-class AmqpMessageBinding(BaseModel):
+class AmqpMessageBinding(AsyncAPIModel):
     """
     This object contains information about the message representation in AMQP.
     """
@@ -130,7 +132,7 @@ class AmqpMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class AmqpOperationBinding(BaseModel):
+class AmqpOperationBinding(AsyncAPIModel):
     """
     This document defines how to describe AMQP-specific information on AsyncAPI.
     """
@@ -223,7 +225,7 @@ class AmqpOperationBinding(BaseModel):
         }
 
 
-class AmqpServerBinding(BaseModel):
+class AmqpServerBinding(AsyncAPIModel):
     """
     This document defines how to describe AMQP-specific information on AsyncAPI.
 
@@ -1,5 +1,7 @@
 from typing import Optional
-from pydantic import BaseModel, Extra
+from pydantic import Extra
+
+from .base_model import AsyncAPIModel
 
 from enum import Enum
 
@@ -12,7 +14,7 @@ class AnypointMqDestinationType(str, Enum):
     fifo = 'fifo-queue'
 
 
-class AnypointMqChannelBinding(BaseModel):
+class AnypointMqChannelBinding(AsyncAPIModel):
     """
     The Anypoint MQ Channel Binding Object.
 
@@ -48,7 +50,7 @@ class AnypointMqChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class AnypointMqMessageBinding(BaseModel):
+class AnypointMqMessageBinding(AsyncAPIModel):
     """
     The Anypoint MQ Message Binding Object is defined by a JSON Schema.
 
@@ -75,7 +77,7 @@ class AnypointMqMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class AnypointMqOperationBinding(BaseModel):
+class AnypointMqOperationBinding(AsyncAPIModel):
     """
     This document defines how to describe Anypoint MQ-specific information in AsyncAPI documents.
 
@@ -86,7 +88,7 @@ class AnypointMqOperationBinding(BaseModel):
         extra = Extra.forbid
 
 
-class AnypointMqServerBinding(BaseModel):
+class AnypointMqServerBinding(AsyncAPIModel):
     """
     This document defines how to describe Anypoint MQ-specific information in
     AsyncAPI documents.
@@ -1,31 +1,277 @@
+import asyncio
 import os
-import yaml
+from concurrent.futures import ThreadPoolExecutor
+
 from .async_api_base import AsyncAPIBase
+from .base_model import interning, validating_protocols
+from .bulk import load_many
+from .dereference import dereference
+from .loaders import YamlLoader, document_loaders
+from .lazy import parse_lazily
+from .ref_resolver import RefResolver
+from .reload import ReloadableDocument
+from .selection import select_channels
+from .snapshot_cache import SnapshotCache
+from .streaming import iter_channels
 
 
 class AsyncAPI(AsyncAPIBase):
 
-    def load_from_file(filename):
-        unresolved_data = AsyncAPI.load_data_from_file(filename)
-        data = AsyncAPI.resolve_external_references(unresolved_data, os.path.dirname(filename))
+    @staticmethod
+    def load_from_file(
+        filename,
+        file_cache=None,
+        max_workers=None,
+        cache_dir=None,
+        dereference_components=False,
+        lazy_references=False,
+        lazy_channels=False,
+        limits=None,
+        intern_references=False,
+        channels=None,
+        protocols=None,
+    ):
+        def load():
+            return AsyncAPI.load_with_sources(
+                filename,
+                file_cache,
+                max_workers,
+                lazy_references,
+                lazy_channels,
+                limits,
+                intern_references,
+                channels,
+                protocols,
+            )
+
+        if cache_dir is not None:
+            # Reuse the validated document while neither the file nor its references changed
+            options = snapshot_options(lazy_references, lazy_channels, intern_references, channels, protocols)
+            async_api = SnapshotCache(cache_dir).load(filename, load, options)
+        else:
+            async_api, _ = load()
+        if dereference_components:
+            # Replace internal references with the shared objects they point to
+            dereference(async_api)
+        return async_api
+
+    @staticmethod
+    def load_reloadable(filename, file_cache=None, limits=None):
+        # Returns a ReloadableDocument: its document attribute is the loaded document, and its
+        # reload method updates it, validating only the channels and components that changed
+        return ReloadableDocument(AsyncAPI, filename, file_cache, limits)
+
+    @staticmethod
+    def load_many(paths, workers=None, keep_documents=True, **kwargs):
+        # Load many files in parallel on a process pool, returning a LoadResult (the document or
+        # the error) per path, in order. The other arguments are those of load_from_file.
+        return load_many(AsyncAPI, paths, workers, keep_documents, **kwargs)
+
+    @staticmethod
+    def load_with_sources(
+        filename,
+        file_cache=None,
+        max_workers=None,
+        lazy_references=False,
+        lazy_channels=False,
+        limits=None,
+        intern_references=False,
+        channels=None,
+        protocols=None,
+    ):
+        # Returns the document together with the paths of the external files it references
+        if file_cache is not None:
+            unresolved_data = file_cache.load(filename, AsyncAPI.load_data_from_file)
+        else:
+            unresolved_data = AsyncAPI.load_data_from_file(filename)
+        resolver = RefResolver(
+            os.path.dirname(filename), AsyncAPI.load_data_from_file, file_cache, max_workers, limits
+        )
+        data = resolver.resolve_document(unresolved_data)
+        async_api = AsyncAPI.parse_data(data, lazy_references, lazy_channels, intern_references, channels, protocols)
+        return async_api, list(resolver.documents)
+
+    @staticmethod
+    def load_from_data(
+        data,
+        base_path=None,
+        resolver=None,
+        file_cache=None,
+        max_workers=None,
+        dereference_components=False,
+        lazy_references=False,
+        lazy_channels=False,
+        limits=None,
+        intern_references=False,
+        channels=None,
+        protocols=None,
+    ):
+        # Load an already parsed document. Relative external references are resolved against
+        # base_path (the current directory by default), or by the given RefResolver, in which
+        # case file_cache, max_workers and limits are the resolver's own.
+        if resolver is None:
+            resolver = RefResolver(base_path or os.curdir, AsyncAPI.load_data_from_file, file_cache, max_workers, limits)
+        data = resolver.resolve_document(data)
+        async_api = AsyncAPI.parse_data(data, lazy_references, lazy_channels, intern_references, channels, protocols)
+        if dereference_components:
+            dereference(async_api)
+        return async_api
+
+    @staticmethod
+    def load_from_bytes(content, base_path=None, resolver=None, **kwargs):
+        # Load a JSON or YAML document from bytes, e.g. received over the network, without a
+        # temporary file. The other arguments are those of load_from_data.
+        return AsyncAPI.load_from_data(AsyncAPI.load_data(content), base_path, resolver, **kwargs)
+
+    @staticmethod
+    def load_from_string(content, base_path=None, resolver=None, **kwargs):
+        return AsyncAPI.load_from_data(AsyncAPI.load_data(content), base_path, resolver, **kwargs)
+
+    @staticmethod
+    def load_from_stream(stream, base_path=None, resolver=None, **kwargs):
+        # Load a document from a binary or text file object. Without a base_path, relative
+        # references are resolved against the directory of the stream's file, if it has one.
+        if base_path is None and resolver is None and isinstance(getattr(stream, "name", None), str):
+            base_path = os.path.dirname(stream.name)
+        return AsyncAPI.load_from_data(AsyncAPI.load_data(stream.read()), base_path, resolver, **kwargs)
+
+    @staticmethod
+    def parse_data(
+        data, lazy_references=False, lazy_channels=False, intern_references=False, channels=None, protocols=None
+    ):
+        if channels is not None:
+            # Only the channels for which channels(channel_uri, channel_data) is true, and the
+            # components they reference, are kept: nothing else is validated
+            data = select_channels(data, channels)
+        if protocols is not None:
+            # Only the bindings of these protocols are validated, the other ones stay raw dicts
+            with validating_protocols(protocols):
+                return AsyncAPI.parse_data(data, lazy_references, lazy_channels, intern_references)
+        if intern_references:
+            # Every inclusion of the same external reference shares one validated object
+            with interning():
+                return AsyncAPI.parse_data(data, lazy_references, lazy_channels)
+        if lazy_references or lazy_channels:
+            # Components and/or channels are only validated when first accessed
+            return parse_lazily(AsyncAPI, data, lazy_references, lazy_channels)
         return AsyncAPI.parse_obj(data)
 
+    @staticmethod
+    def iter_channels_from_file(filename, file_cache=None, limits=None):
+        # Yields (channel_uri, ChannelItem) pairs parsed one at a time from the YAML event stream,
+        # so memory is bounded by the largest channel rather than by the whole document.
+        # References to components are LazyReference proxies, validated when first used.
+        resolver = RefResolver(os.path.dirname(filename), AsyncAPI.load_data_from_file, file_cache, limits=limits)
+        return iter_channels(AsyncAPI, lambda: open(filename, "rb"), YamlLoader, resolver)
+
+    @staticmethod
+    async def aload_from_file(
+        filename,
+        file_cache=None,
+        executor=None,
+        max_workers=None,
+        cache_dir=None,
+        dereference_components=False,
+        lazy_references=False,
+        lazy_channels=False,
+        limits=None,
+        intern_references=False,
+        channels=None,
+        protocols=None,
+    ):
+        # File reads, YAML parsing and validation run on executor (the loop's default thread
+        # pool when None, or a pool of max_workers threads for this load), so the event loop is
+        # never blocked and loads can run concurrently. The other arguments are those of
+        # load_from_file.
+        own_executor = ThreadPoolExecutor(max_workers) if executor is None and max_workers else None
+        try:
+            return await AsyncAPI._aload_from_file(
+                filename,
+                file_cache,
+                executor or own_executor,
+                cache_dir,
+                dereference_components,
+                lazy_references,
+                lazy_channels,
+                limits,
+                intern_references,
+                channels,
+                protocols,
+            )
+        finally:
+            if own_executor is not None:
+                own_executor.shutdown(wait=False)
+
+    @staticmethod
+    async def _aload_from_file(
+        filename,
+        file_cache,
+        executor,
+        cache_dir,
+        dereference_components,
+        lazy_references,
+        lazy_channels,
+        limits,
+        intern_references,
+        channels,
+        protocols,
+    ):
+        loop = asyncio.get_running_loop()
+        if cache_dir is not None:
+            options = snapshot_options(lazy_references, lazy_channels, intern_references, channels, protocols)
+
+            def load():
+                return AsyncAPI.load_with_sources(
+                    filename, file_cache, None, lazy_references, lazy_channels, limits, intern_references
+                )
+
+            # Snapshots are checked, and on a miss the document is loaded, on the executor
+            async_api = await loop.run_in_executor(executor, SnapshotCache(cache_dir).load, filename, load, options)
+        else:
+            if file_cache is not None:
+                unresolved_data = await loop.run_in_executor(
+                    executor, file_cache.load, filename, AsyncAPI.load_data_from_file
+                )
+            else:
+                unresolved_data = await loop.run_in_executor(executor, AsyncAPI.load_data_from_file, filename)
+            resolver = RefResolver(os.path.dirname(filename), AsyncAPI.load_data_from_file, file_cache, limits=limits)
+            await resolver.aprefetch(unresolved_data, executor)
+            data = await loop.run_in_executor(executor, resolver.resolve, unresolved_data)
+            async_api = await loop.run_in_executor(
+                executor, AsyncAPI.parse_data, data, lazy_references, lazy_channels, intern_references, channels, protocols
+            )
+        if dereference_components:
+            await loop.run_in_executor(executor, dereference, async_api)
+        return async_api
+
     @staticmethod
     def load_data_from_file(filename):
-        # Currently only load data from YAML files
-        with open(filename) as f:
-            data = yaml.load(f, Loader=yaml.FullLoader)
-            return data
-
-    @staticmethod
-    def resolve_external_references(data, files_folder):
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key == '$ref' and not value.startswith("#/components") and value.endswith(".yaml"):
-                    data = AsyncAPI.resolve_external_references(AsyncAPI.load_data_from_file(os.path.join(files_folder, value)), files_folder)
-                else:
-                    data[key] = AsyncAPI.resolve_external_references(value, files_folder)
-        elif isinstance(data, list):
-            for index, value in enumerate(data):
-                data[index] = AsyncAPI.resolve_external_references(value, files_folder)
-        return data
+        # Load data from JSON, YAML or TOML files, with the loader registered in document_loaders
+        # for the file extension. Large files are mapped in memory rather than read.
+        return document_loaders.load_file(filename)
+
+    @staticmethod
+    def load_data(content, filename=None):
+        # Load data from a document given as str, bytes or mmap. Unless a filename selects the
+        # loader by its extension, documents are parsed as YAML, or as JSON when they look like it.
+        return document_loaders.load(content, filename)
+
+    @staticmethod
+    def resolve_external_references(data, files_folder, file_cache=None, max_workers=None, limits=None):
+        # Each referenced file is parsed once per call, or once per process with a FileCache.
+        # With max_workers, referenced files are read concurrently before being inlined.
+        # Cycles raise a RefCycleError, and limits (ResolutionLimits) bound the work done.
+        resolver = RefResolver(files_folder, AsyncAPI.load_data_from_file, file_cache, max_workers, limits)
+        return resolver.resolve_document(data)
+
+
+def snapshot_options(lazy_references, lazy_channels, intern_references, channels, protocols):
+    """The options of ``SnapshotCache.load`` for a document loaded with these arguments."""
+    if channels is not None or protocols is not None:
+        # Snapshots hold the whole, fully validated document
+        raise ValueError("cache_dir cannot be combined with channels or protocols")
+    return {
+        "lazy_references": lazy_references,
+        "lazy_channels": lazy_channels,
+        "intern_references": intern_references,
+    }
@@ -1,7 +1,8 @@
 from typing import Dict, List, Optional, Union
 
-from pydantic import BaseModel, Extra, Field
+from pydantic import Extra, Field
 
+from .base_model import AsyncAPIModel
 from .components import Components
 from .external_documentation import ExternalDocumentation
 from .info import Info
@@ -12,7 +13,7 @@ from .channel import ChannelItem, ChannelUri
 from .tag import Tag
 
 
-class AsyncAPIBase(BaseModel):
+class AsyncAPIBase(AsyncAPIModel):
     """This is the root document object of the AsyncAPI document."""
 
     asyncapi: str = "2.3.0"
@@ -0,0 +1,238 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from hashlib import blake2b
+
+from pydantic import BaseModel
+
+from .construct import trusted_construct
+
+_interned = ContextVar("interned", default=None)
+_subtree_memo = ContextVar("subtree_memo", default=None)
+_protocols = ContextVar("protocols", default=None)
+
+SCALAR_TAGS = {str: b"s", int: b"i", float: b"f", bool: b"b", type(None): b"n"}
+
+PROTOCOLS = frozenset(
+    ["http", "ws", "kafka", "anypointmq", "amqp", "amqp1", "mqtt", "mqtt5", "nats", "jms", "sns", "solace", "sqs",
+     "stomp", "redis", "mercure", "ibmmq"]
+)
+"""The protocols of the bindings objects."""
+
+
+@contextmanager
+def interning():
+    """
+    Within this context, every model validated from the same ``dict`` object is validated once,
+    and all the places the ``dict`` appears in share the resulting model instance.
+
+    The trees inlined for repeated external references are shared ``dict`` objects (see
+    ``RefResolver``), so in this context validation time and memory scale with the unique content
+    of a document rather than with the number of references. Shared instances are not copied:
+    changing one of them changes it everywhere it is used.
+    """
+    token = _interned.set({})
+    try:
+        yield
+    finally:
+        _interned.reset(token)
+
+
+def interned_instances():
+    """
+    The instances validated in the current ``interning()`` context, as ``(dict, instance)`` by
+    ``(model class, id of the dict)``, or None outside of it.
+    """
+    return _interned.get()
+
+
+@contextmanager
+def validating_protocols(protocols):
+    """
+    Within this context, the bindings of the protocols other than ``protocols`` are kept as the
+    raw mappings they are in the data, without being validated (see ``BindingsModel``). With
+    ``protocols=None``, the bindings of every protocol are validated.
+    """
+    if protocols is not None:
+        protocols = frozenset(protocols)
+        unknown = protocols - PROTOCOLS
+        if unknown:
+            raise ValueError(f"Unknown protocols: {', '.join(sorted(unknown))}")
+    token = _protocols.set(protocols)
+    try:
+        yield
+    finally:
+        _protocols.reset(token)
+
+
+def validated_protocols():
+    """The protocols whose bindings are validated in the current context, or None for all of them."""
+    return _protocols.get()
+
+
+class SubtreeMemo:
+    """
+    Within this context manager, mappings with the same content validated as the same model class
+    are validated once and share the resulting instance, e.g. the pagination envelopes or error
+    objects repeated inline throughout a specification. Unlike ``interning()``, which recognizes
+    the same ``dict`` object, mappings are recognized by a hash of their whole subtree (keys in
+    order, and values with their types), computed once per mapping.
+
+    Only the models setting ``__memoize_subtrees__`` are memoized (``Schema`` and the other JSON
+    schema objects, ``Message``, ``MessageTrait`` and the bindings), unless ``model_classes`` are
+    given. ``hits`` and ``misses`` count the lookups, ``ratio`` the share of hits. Shared
+    instances are not copied: changing one of them changes it everywhere it is used. They are
+    kept with the memo, so a memo used for several documents shares them across documents.
+    """
+
+    def __init__(self, model_classes=None):
+        self.model_classes = tuple(model_classes) if model_classes is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._instances = {}
+        self._digests = {}
+        self._tokens = []
+
+    @property
+    def ratio(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __enter__(self):
+        self._tokens.append(_subtree_memo.set(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        _subtree_memo.reset(self._tokens.pop())
+        # Digests are cached by id: they are only valid while the data is alive
+        self._digests = {}
+
+    def key(self, model_class, value):
+        """The memo key of the mapping ``value`` validated as ``model_class``, or None if it isn't memoized."""
+        if self.model_classes is None:
+            if not model_class.__memoize_subtrees__:
+                return None
+        elif not issubclass(model_class, self.model_classes):
+            return None
+        digest = self.digest(value)
+        # Instances validated with other protocols hold other raw bindings
+        return (model_class, digest, _protocols.get()) if digest is not None else None
+
+    def get(self, key):
+        instance = self._instances.get(key)
+        if instance is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return instance
+
+    def put(self, key, instance):
+        self._instances[key] = instance
+
+    def digest(self, value):
+        """
+        The hash of the subtree of ``value``, or None if it holds values other than the JSON ones
+        (e.g. model instances) or contains itself (e.g. recursive YAML anchors). Computed with an
+        explicit stack, for deep schemas.
+        """
+        digests = self._digests
+        entry = digests.get(id(value))
+        if entry is not None:
+            return entry[1]
+        # The nodes whose children are being hashed: the ancestors of the current node
+        visiting = set()
+        stack = [(value, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if id(node) in digests:
+                continue
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+            if not children_done:
+                visiting.add(id(node))
+                stack.append((node, True))
+                stack.extend(
+                    (item, False) for _, item in items
+                    if isinstance(item, (dict, list)) and id(item) not in digests and id(item) not in visiting
+                )
+                continue
+            visiting.discard(id(node))
+            hash_ = blake2b(b"d" if isinstance(node, dict) else b"l", digest_size=16)
+            for key, item in items:
+                if isinstance(node, dict):
+                    encoded = encode_scalar(key)
+                    if encoded is None:
+                        break
+                    hash_.update(encoded)
+                if isinstance(item, (dict, list)):
+                    # Missing for an ancestor: the subtree contains itself
+                    encoded = digests.get(id(item), (None, None))[1]
+                else:
+                    encoded = encode_scalar(item)
+                if encoded is None:
+                    break
+                hash_.update(encoded)
+            else:
+                # The node is kept with its digest, so that its id can't be reused
+                digests[id(node)] = (node, hash_.digest())
+                continue
+            digests[id(node)] = (node, None)
+        return digests[id(value)][1]
+
+
+def encode_scalar(value):
+    tag = SCALAR_TAGS.get(type(value))
+    if tag is None:
+        return None
+    data = value.encode("utf-8", "surrogatepass") if tag == b"s" else repr(value).encode()
+    return b"%s%d:%s" % (tag, len(data), data)
+
+
+def sharing_instances():
+    """Whether a context sharing validated instances (``interning()``, ``SubtreeMemo``) is active."""
+    return _interned.get() is not None or _subtree_memo.get() is not None
+
+
+def subtree_memo():
+    """The ``SubtreeMemo`` of the current context, or None."""
+    return _subtree_memo.get()
+
+
+class AsyncAPIModel(BaseModel):
+    """Base class of the AsyncAPI objects."""
+
+    @classmethod
+    def construct_trusted(cls, data):
+        """
+        Build an instance from ``data`` without validating it, unlike ``construct`` recursively:
+        nested objects are built as their models, e.g. ``ChannelItem`` or ``Schema``. Values are
+        not converted (other than enumerations), so only use it with data known to be valid,
+        e.g. previously validated and serialized with ``by_alias=True``.
+        """
+        return trusted_construct(cls, data)
+
+    __memoize_subtrees__ = False
+    """Whether ``SubtreeMemo`` shares the instances validated from mappings with the same content."""
+
+    @classmethod
+    def validate(cls, value):
+        interned = _interned.get()
+        memo = _subtree_memo.get()
+        if interned is None and memo is None or not isinstance(value, dict):
+            return cls._validate(value)
+        if interned is not None:
+            entry = interned.get((cls, id(value)))
+            if entry is not None:
+                return entry[1]
+        key = memo.key(cls, value) if memo is not None else None
+        instance = memo.get(key) if key is not None else None
+        if instance is None:
+            instance = cls._validate(value)
+            if key is not None:
+                memo.put(key, instance)
+        if interned is not None:
+            # The source dict is kept with the instance, so that its id can't be reused
+            interned[(cls, id(value))] = (value, instance)
+        return instance
+
+    @classmethod
+    def _validate(cls, value):
+        return super().validate(value)
@@ -0,0 +1,22 @@
+from typing import Any
+
+from .base_model import AsyncAPIModel, validated_protocols
+
+
+class BindingsModel(AsyncAPIModel):
+    """
+    Base class of the maps of protocol-specific bindings, whose fields are the protocols. In a
+    ``validating_protocols()`` context, the bindings of the other protocols are set as the raw
+    mappings of the data, without being validated.
+    """
+
+    def __init__(self, **data: Any) -> None:
+        protocols = validated_protocols()
+        if protocols is None:
+            super().__init__(**data)
+            return
+        skipped = {key: item for key, item in data.items() if key in self.__fields__ and key not in protocols}
+        super().__init__(**{key: item for key, item in data.items() if key not in skipped})
+        # Set like validation would, keeping the field order of __dict__
+        self.__dict__.update(skipped)
+        self.__fields_set__.update(skipped)
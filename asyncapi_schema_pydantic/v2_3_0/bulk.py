@@ -0,0 +1,94 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from .file_cache import FileCache
+
+_worker = {}
+
+
+class LoadError(BaseModel):
+    """Why a file of a bulk load could not be loaded."""
+
+    type: str
+    """
+    Name of the exception raised, e.g. ``ValidationError``, ``RefResolutionError`` or ``FileNotFoundError``.
+    """
+
+    message: str
+    """
+    The exception message.
+    """
+
+    errors: Optional[List[Dict[str, Any]]] = None
+    """
+    For a ``ValidationError``, the list of errors found, as returned by its ``errors()`` method.
+    """
+
+
+class LoadResult(BaseModel):
+    """The outcome of loading one file of a bulk load: either its document or an error."""
+
+    path: str
+    """
+    The path of the file, as given.
+    """
+
+    document: Optional[Any] = None
+    """
+    The loaded document, unless loading failed or documents were not requested.
+    """
+
+    error: Optional[LoadError] = None
+    """
+    Why loading failed, if it did.
+    """
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def load_result(model_class, path, keep_documents, options, file_cache):
+    try:
+        document = model_class.load_from_file(path, file_cache=file_cache, **options)
+    except Exception as e:
+        errors = e.errors() if isinstance(e, ValidationError) else None
+        return LoadResult(path=os.fspath(path), error=LoadError(type=type(e).__name__, message=str(e), errors=errors))
+    return LoadResult(path=os.fspath(path), document=document if keep_documents else None)
+
+
+def _init_worker(model_class, keep_documents, options):
+    # Each worker process has its own cache, shared by all the files it loads
+    _worker.update(model_class=model_class, keep_documents=keep_documents, options=options, file_cache=FileCache())
+
+
+def _load_in_worker(path):
+    return load_result(
+        _worker["model_class"], path, _worker["keep_documents"], _worker["options"], _worker["file_cache"]
+    )
+
+
+def load_many(model_class, paths, workers=None, keep_documents=True, **options):
+    """
+    Load and validate many files with ``model_class.load_from_file`` on a pool of ``workers``
+    processes (one per CPU by default), returning a ``LoadResult`` per path, in order.
+
+    Failures are reported in the results rather than raised. Each worker keeps a ``FileCache``, so
+    files referenced from several documents are parsed once per worker. Sending the documents
+    back from the workers has a cost: pass ``keep_documents=False`` when only the errors matter.
+    """
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        file_cache = FileCache()
+        return [load_result(model_class, path, keep_documents, options, file_cache) for path in paths]
+
+    # Send the paths in chunks to limit the inter-process overhead, while keeping enough
+    # chunks per worker to balance the load
+    chunksize = max(1, len(paths) // (workers * 4))
+    initargs = (model_class, keep_documents, options)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as executor:
+        return list(executor.map(_load_in_worker, paths, chunksize=chunksize))
@@ -1,16 +1,16 @@
 from typing import Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, Extra, constr
+from pydantic import Field, Extra
 
-from .reference import Reference
+from .base_model import AsyncAPIModel
+from .channel_uri import ChannelUri
+from .reference import Reference, reference_dispatcher
 from .channel_bindings import ChannelBindings
 from .operation import Operation
 from .parameter import Parameter, ParameterName
 
-ChannelUri = constr(regex=r"^([^\x00-\x20\x7f\"'%<>\\^`{|}]|%[0-9A-Fa-f]{2}|{[+#./;?&=,!@|]?((\w|%[0-9A-Fa-f]{2})(\.?(\w|%[0-9A-Fa-f]{2}))*(:[1-9]\d{0,3}|\*)?)(,((\w|%[0-9A-Fa-f]{2})(\.?(\w|%[0-9A-Fa-f]{2}))*(:[1-9]\d{0,3}|\*)?))*})*$")
 
-
-class ChannelItem(BaseModel):
+class ChannelItem(AsyncAPIModel):
     """Describes the operations available on a single channel."""
 
     ref: Optional[str] = Field(alias="$ref")
@@ -60,9 +60,13 @@ class ChannelItem(BaseModel):
     protocol-specific definitions for the channel.
     """
 
+    _dispatch_references = reference_dispatcher("bindings")
+    _dispatch_reference_items = reference_dispatcher("parameters", each_item=True)
+
 
     class Config:
         extra = Extra.forbid
+        smart_union = True
         schema_extra = {
             "examples": [
                             {
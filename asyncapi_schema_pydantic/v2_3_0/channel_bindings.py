@@ -1,7 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .bindings import BindingsModel
 from .http_bindings import HttpChannelBinding
 from .web_sockets_bindings import WebSocketsChannelBinding
 from .kafka_bindings import KafkaChannelBinding
@@ -21,11 +22,13 @@ from .mercure_bindings import MercureChannelBinding
 from .ibm_mq_bindings import IbmMqChannelBinding
 
 
-class ChannelBindings(BaseModel):
+class ChannelBindings(BindingsModel):
     """
     Map describing protocol-specific definitions for a channel.
     """
 
+    __memoize_subtrees__ = True
+
     http: Optional[HttpChannelBinding] = None
     """
     Protocol-specific information for an HTTP channel.
@@ -0,0 +1,141 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple, Union
+
+from pydantic.errors import PydanticValueError
+from pydantic.validators import str_validator
+
+CHANNEL_URI_PATTERN = r"^([^\x00-\x20\x7f\"'%<>\\^`{|}]|%[0-9A-Fa-f]{2}|{[+#./;?&=,!@|]?((\w|%[0-9A-Fa-f]{2})(\.?(\w|%[0-9A-Fa-f]{2}))*(:[1-9]\d{0,3}|\*)?)(,((\w|%[0-9A-Fa-f]{2})(\.?(\w|%[0-9A-Fa-f]{2}))*(:[1-9]\d{0,3}|\*)?))*})*$"
+"""
+The RFC 6570 URI template grammar of channel names, as a regular expression. It is only used in
+the JSON schema: channel names are checked by ``parse_channel_uri``, which also parses them.
+"""
+
+# Each repetition in these consumes at least one character, and no two alternatives can start
+# with the same character: a string can only match one way, so matching them is linear
+LITERALS = re.compile(r"(?:[^\x00-\x20\x7f\"'%<>\\^`{|}]|%[0-9A-Fa-f]{2})*")
+VARIABLE_NAME = re.compile(r"(?:\w|%[0-9A-Fa-f]{2})(?:\.?(?:\w|%[0-9A-Fa-f]{2}))*")
+MODIFIER = re.compile(r":[1-9]\d{0,3}|\*")
+VARIABLE = rf"(?:{VARIABLE_NAME.pattern})(?:{MODIFIER.pattern})?"
+EXPRESSION = re.compile(rf"\{{([+#./;?&=,!@|]?)({VARIABLE}(?:,{VARIABLE})*)\}}")
+
+OPERATORS = frozenset("+#./;?&=,!@|")
+
+
+class ChannelUriError(PydanticValueError):
+    code = "channel_uri"
+    msg_template = "invalid channel URI: {reason} at position {position}"
+
+
+class ChannelVariable(NamedTuple):
+    """A variable of a channel URI expression, e.g. ``userId`` in ``{userId}``."""
+
+    name: str
+    prefix: Optional[int] = None
+    """The maximum length of the value, from a ``:<length>`` modifier."""
+    explode: bool = False
+    """Whether the variable has the ``*`` modifier."""
+
+
+class ChannelExpression(NamedTuple):
+    """A ``{...}`` expression of a channel URI: an optional operator and its variables."""
+
+    operator: str
+    variables: Tuple[ChannelVariable, ...]
+
+
+class ChannelTemplate(NamedTuple):
+    """A parsed channel URI: its literal parts and expressions, in order."""
+
+    uri: str
+    segments: Tuple[Union[str, ChannelExpression], ...]
+
+    @property
+    def parameters(self):
+        """The names of the variables, in order and without duplicates."""
+        names = {}
+        for segment in self.segments:
+            if isinstance(segment, ChannelExpression):
+                for variable in segment.variables:
+                    names[variable.name] = None
+        return tuple(names)
+
+
+@lru_cache(maxsize=4096)
+def parse_channel_uri(uri):
+    """
+    Parse the channel URI ``uri``, or raise a ``ChannelUriError`` giving the position of the first
+    invalid character. Runs in linear time; templates are cached by URI, so routing code can call
+    it for every channel of every loaded document.
+    """
+    segments = []
+    position = 0
+    end = len(uri)
+    while True:
+        literal_end = LITERALS.match(uri, position).end()
+        if literal_end > position:
+            segments.append(uri[position:literal_end])
+        position = literal_end
+        if position == end:
+            return ChannelTemplate(uri, tuple(segments))
+        expression = EXPRESSION.match(uri, position)
+        if expression is None:
+            raise invalid_channel_uri(uri, position)
+        operator, variables = expression.groups()
+        segments.append(ChannelExpression(operator, tuple(map(parse_variable, variables.split(",")))))
+        position = expression.end()
+
+
+def parse_variable(variable):
+    if variable[-1] == "*":
+        return ChannelVariable(variable[:-1], explode=True)
+    name, _, prefix = variable.partition(":")
+    return ChannelVariable(name, int(prefix) if prefix else None)
+
+
+def invalid_channel_uri(uri, position):
+    """Return the error of the invalid channel URI ``uri``, whose valid prefix ends at ``position``."""
+    if uri[position] == "%":
+        return ChannelUriError(reason="invalid percent-encoding", position=position)
+    if uri[position] != "{":
+        return ChannelUriError(reason=f"invalid character {uri[position]!r}", position=position)
+    position += 1
+    if position < len(uri) and uri[position] in OPERATORS:
+        position += 1
+    while True:
+        name = VARIABLE_NAME.match(uri, position)
+        if name is None:
+            return ChannelUriError(reason="expected a variable name", position=position)
+        position = name.end()
+        modifier = MODIFIER.match(uri, position)
+        if modifier is not None:
+            position = modifier.end()
+        if position == len(uri):
+            return ChannelUriError(reason="unterminated expression", position=position)
+        if uri[position] != ",":
+            return ChannelUriError(reason=f"invalid character {uri[position]!r} in expression", position=position)
+        position += 1
+
+
+class ChannelUri(str):
+    """
+    The name of a channel, a URI template: validated by ``parse_channel_uri``, which caches the
+    parsed template. Values are kept as plain ``str``.
+    """
+
+    regex = re.compile(CHANNEL_URI_PATTERN)
+    """Only used in the JSON schema, as for a ``constr``."""
+
+    @classmethod
+    def __get_validators__(cls):
+        yield str_validator
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema):
+        field_schema.update(pattern=CHANNEL_URI_PATTERN)
+
+    @classmethod
+    def validate(cls, value):
+        parse_channel_uri(value)
+        return value
@@ -1,9 +1,10 @@
 from typing import Dict, Optional, Union
 
-from pydantic import BaseModel, Extra, constr
+from pydantic import Extra, constr
 
+from .base_model import AsyncAPIModel
 from .parameter import Parameter
-from .reference import Reference
+from .reference import Reference, reference_dispatcher
 from .schema import Schema
 from .server import Server
 from .channel import ChannelItem
@@ -21,7 +22,7 @@ from .message_bindings import MessageBindings
 ComponentKey = constr(regex=r"^[A-Za-z0-9_\-]+$")
 
 
-class Components(BaseModel):
+class Components(AsyncAPIModel):
     """
     Holds a set of reusable objects for different aspects of the AsyncAPI specification. All
     objects defined within the components object will have no effect on the API unless they
@@ -93,9 +94,25 @@ class Components(BaseModel):
     An object to hold reusable Message Bindings Objects.
     """
 
+    _dispatch_reference_items = reference_dispatcher(
+        "servers",
+        "messages",
+        "securitySchemes",
+        "parameters",
+        "correlationIds",
+        "operationTraits",
+        "messageTraits",
+        "serverBindings",
+        "channelBindings",
+        "operationBindings",
+        "messageBindings",
+        each_item=True,
+    )
+
 
     class Config:
         extra = Extra.forbid
+        smart_union = True
         schema_extra = {
             "examples": [
                             {
@@ -0,0 +1,138 @@
+from enum import Enum
+
+from pydantic import BaseModel, Extra
+from pydantic.fields import (
+    SHAPE_DEFAULTDICT,
+    SHAPE_DICT,
+    SHAPE_LIST,
+    SHAPE_MAPPING,
+    SHAPE_SEQUENCE,
+    SHAPE_SINGLETON,
+)
+
+_plans = {}
+
+_object_setattr = object.__setattr__
+
+_MISSING = object()
+
+IMMUTABLE_TYPES = (bool, int, float, str, bytes, tuple, frozenset, Enum)
+
+
+class ConstructPlan:
+    """How to build the instances of a model class from trusted data, computed once per class."""
+
+    __slots__ = ("template", "by_alias", "required", "copied_defaults", "required_aliases", "forbid", "prepare")
+
+    def __init__(self, model_class):
+        # Values in field order, as validation would set them, with the immutable defaults
+        # already in place: the other ones are filled in after the data is copied over
+        self.template = {}
+        self.by_alias = {}
+        self.required = []
+        self.copied_defaults = []
+        for name, field in model_class.__fields__.items():
+            self.by_alias[field.alias] = (name, value_builder(field))
+            if field.required:
+                self.template[name] = _MISSING
+                self.required.append(name)
+            elif field.default_factory is None and (field.default is None or isinstance(field.default, IMMUTABLE_TYPES)):
+                self.template[name] = field.default
+            else:
+                self.template[name] = _MISSING
+                self.copied_defaults.append((name, field))
+        self.required_aliases = {field.alias for field in model_class.__fields__.values() if field.required}
+        self.forbid = model_class.__config__.extra == Extra.forbid
+        self.prepare = getattr(model_class, "_prepare_trusted", None)
+
+    def accepts(self, data):
+        """Whether validating ``data`` would not fail because of missing or unknown keys."""
+        keys = data.keys()
+        return self.required_aliases <= keys and (not self.forbid or keys <= self.by_alias.keys())
+
+
+def construct_plan(model_class):
+    plan = _plans.get(model_class)
+    if plan is None:
+        plan = _plans[model_class] = ConstructPlan(model_class)
+    return plan
+
+
+def trusted_construct(model_class, data):
+    """
+    Build an instance of ``model_class`` from ``data`` recursively, without validating it: nested
+    mappings become the models of their fields, looked up by alias. ``data`` must be valid.
+    """
+    plan = construct_plan(model_class)
+    if plan.prepare is not None:
+        data = plan.prepare(data)
+    values = plan.template.copy()
+    fields_set = set()
+    by_alias = plan.by_alias
+    for key, value in data.items():
+        entry = by_alias.get(key)
+        if entry is not None:
+            name, build = entry
+            values[name] = value if build is None else build(value)
+            fields_set.add(name)
+    for name, field in plan.copied_defaults:
+        if values[name] is _MISSING:
+            values[name] = field.get_default()
+    for name in plan.required:
+        if values[name] is _MISSING:
+            del values[name]
+
+    model = model_class.__new__(model_class)
+    _object_setattr(model, "__dict__", values)
+    _object_setattr(model, "__fields_set__", fields_set)
+    model._init_private_attributes()
+    return model
+
+
+def value_builder(field):
+    """Return a function building the values of ``field`` from trusted data, or None if they are kept as they are."""
+    shape = field.shape
+    if shape in (SHAPE_LIST, SHAPE_SEQUENCE):
+        build_item = value_builder(field.sub_fields[0])
+        if build_item is None:
+            return None
+        return lambda value: [build_item(item) for item in value] if isinstance(value, list) else value
+
+    if shape in (SHAPE_DICT, SHAPE_MAPPING, SHAPE_DEFAULTDICT):
+        build_item = value_builder(field.sub_fields[0])
+        if build_item is None:
+            return None
+        return lambda value: {key: build_item(item) for key, item in value.items()} if isinstance(value, dict) else value
+
+    if shape != SHAPE_SINGLETON:
+        return None
+
+    if field.sub_fields:
+        # A Union: like pydantic, use the first member that would accept the value
+        models = [sub_field.type_ for sub_field in field.sub_fields if is_model_field(sub_field)]
+        sequences = [sub_field for sub_field in field.sub_fields if sub_field.shape in (SHAPE_LIST, SHAPE_SEQUENCE)]
+        build_sequence = value_builder(sequences[0]) if sequences else None
+        if not models and build_sequence is None:
+            return None
+
+        def build_union(value):
+            if isinstance(value, dict):
+                for model_class in models:
+                    if construct_plan(model_class).accepts(value):
+                        return trusted_construct(model_class, value)
+            elif isinstance(value, list) and build_sequence is not None:
+                return build_sequence(value)
+            return value
+
+        return build_union
+
+    type_ = field.type_
+    if is_model_field(field):
+        return lambda value: trusted_construct(type_, value) if isinstance(value, dict) else value
+    if isinstance(type_, type) and issubclass(type_, Enum):
+        return lambda value: type_(value) if value is not None else None
+    return None
+
+
+def is_model_field(field):
+    return field.shape == SHAPE_SINGLETON and isinstance(field.type_, type) and issubclass(field.type_, BaseModel)
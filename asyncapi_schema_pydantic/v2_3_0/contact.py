@@ -1,9 +1,11 @@
 from typing import Optional
 
-from pydantic import AnyUrl, BaseModel, Extra
+from pydantic import AnyUrl, Extra
 
+from .base_model import AsyncAPIModel
 
-class Contact(BaseModel):
+
+class Contact(AsyncAPIModel):
     """
     Contact information for the exposed API.
     """
@@ -1,9 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class CorrelationId(BaseModel):
+
+class CorrelationId(AsyncAPIModel):
     """
     An object that specifies an identifier at design time that can used for message tracing
     and correlation. For specifying and computing the location of a Correlation ID, a runtime
@@ -0,0 +1,95 @@
+from pydantic import BaseModel
+
+from .json_schema import JsonSchemaObject
+from .reference import Reference
+
+
+def escape_pointer_token(token):
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def build_pointer_index(document):
+    """
+    Map the JSON pointer (e.g. ``#/components/schemas/User``) of every model object of
+    ``document`` to the object itself. Pointers use the field aliases, as in the source document.
+    """
+    index = {}
+    stack = [("#", document)]
+    while stack:
+        pointer, node = stack.pop()
+        if isinstance(node, BaseModel):
+            index[pointer] = node
+            for name, field in node.__fields__.items():
+                value = node.__dict__.get(name)
+                if isinstance(value, (BaseModel, dict, list)):
+                    stack.append((pointer + "/" + escape_pointer_token(field.alias), value))
+        elif isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(value, (BaseModel, dict, list)):
+                    stack.append((pointer + "/" + escape_pointer_token(key), value))
+        else:
+            for position, value in enumerate(node):
+                if isinstance(value, (BaseModel, dict, list)):
+                    stack.append((pointer + "/" + str(position), value))
+    return index
+
+
+def reference_target(value, index):
+    """Return the object ``value`` refers to when it is an internal reference, otherwise None."""
+    seen = set()
+    target = None
+    while True:
+        if isinstance(value, Reference):
+            ref = value.ref
+        elif (
+            isinstance(value, JsonSchemaObject)
+            and value.ref
+            and not value.extras
+            and not value.__fields_set__ - {"ref", "extras"}
+        ):
+            # A schema holding nothing but a $ref: its extensions would be lost
+            ref = value.ref
+        else:
+            return target
+        if not ref.startswith("#/") or ref in seen or ref not in index:
+            return target
+        seen.add(ref)
+        value = target = index[ref]
+
+
+def dereference(document, index=None):
+    """
+    Replace, in place, the internal references (``$ref: '#/...'``) of ``document`` with the
+    objects they point to, looked up in a JSON pointer index built once for the whole document.
+
+    Every reference to a component is replaced by the same shared object, not a copy. Recursive
+    schemas therefore become cyclic object graphs, which can be traversed but not serialized.
+    """
+    if index is None:
+        index = build_pointer_index(document)
+
+    visited = set()
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+
+        if isinstance(node, BaseModel):
+            items = [(name, node.__dict__.get(name)) for name in node.__fields__]
+            container = node.__dict__
+        elif isinstance(node, dict):
+            items = list(node.items())
+            container = node
+        else:
+            items = list(enumerate(node))
+            container = node
+
+        for key, value in items:
+            target = reference_target(value, index)
+            if target is not None:
+                container[key] = value = target
+            if isinstance(value, (BaseModel, dict, list)):
+                stack.append(value)
+    return document
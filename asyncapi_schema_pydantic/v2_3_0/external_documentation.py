@@ -1,9 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel, Extra, AnyUrl
+from pydantic import Extra, AnyUrl
 
+from .base_model import AsyncAPIModel
 
-class ExternalDocumentation(BaseModel):
+
+class ExternalDocumentation(AsyncAPIModel):
     """
     Allows referencing an external resource for extended documentation.
     """
@@ -0,0 +1,58 @@
+import os
+import threading
+from collections import OrderedDict
+
+
+def normalize_path(path):
+    """Return the normalized absolute form of ``path``, used as cache key for documents."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def file_signature(path):
+    """Return the modification time and size of ``path``, which change whenever it is modified."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileCache:
+    """
+    Process-wide LRU cache of parsed documents, keyed on the normalized absolute path
+    of the file.
+
+    An entry is only reused while the modification time and size of its file are
+    unchanged, so a single instance can be shared by every load in the process.
+    Cached documents are handed out to several callers and must be treated as read-only.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, path, loader):
+        """Return the parsed content of ``path``, calling ``loader(path)`` on a cache miss."""
+        path = normalize_path(path)
+        signature = file_signature(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(path)
+                return entry[1]
+
+        data = loader(path)
+        with self._lock:
+            self._entries[path] = (signature, data)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path):
+        return normalize_path(path) in self._entries
@@ -1,11 +1,12 @@
 from typing import Optional
 from enum import Enum
-from pydantic import BaseModel, Field, Extra
+from pydantic import Field, Extra
 
+from .base_model import AsyncAPIModel
 from .schema import Schema
 
 
-class HttpChannelBinding(BaseModel):
+class HttpChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe HTTP-specific information on AsyncAPI.
 
@@ -17,7 +18,7 @@ class HttpChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class HttpMessageBinding(BaseModel):
+class HttpMessageBinding(AsyncAPIModel):
     """
     This object contains information about the message representation in HTTP.
     """
@@ -37,7 +38,7 @@ class HttpMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class HttpServerBinding(BaseModel):
+class HttpServerBinding(AsyncAPIModel):
     """
     This document defines how to describe HTTP-specific information on AsyncAPI.
 
@@ -53,7 +54,7 @@ class HttpOperationBindingType(str, Enum):
     response = 'response'
 
 
-class HttpOperationBinding(BaseModel):
+class HttpOperationBinding(AsyncAPIModel):
     """
     This document defines how to describe HTTP-specific information on AsyncAPI.
     """
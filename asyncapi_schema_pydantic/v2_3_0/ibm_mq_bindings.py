@@ -2,7 +2,9 @@ from typing import Optional
 
 from enum import Enum
 
-from pydantic import BaseModel, Extra, Field
+from pydantic import Extra, Field
+
+from .base_model import AsyncAPIModel
 
 
 class IbmMqDestinationType(str, Enum):
@@ -10,7 +12,7 @@ class IbmMqDestinationType(str, Enum):
     queue = 'queue'
 
 
-class IbmMqTopic(BaseModel):
+class IbmMqTopic(AsyncAPIModel):
     """
     Defines the properties of a topic.
     """
@@ -42,7 +44,7 @@ class IbmMqTopic(BaseModel):
         extra = Extra.forbid
 
 
-class IbmMqQueue(BaseModel):
+class IbmMqQueue(AsyncAPIModel):
     """
     Defines the properties of a queue.
     """
@@ -74,7 +76,7 @@ class IbmMqQueue(BaseModel):
         extra = Extra.forbid
 
 
-class IbmMqChannelBinding(BaseModel):
+class IbmMqChannelBinding(AsyncAPIModel):
     """
     This object contains information about the channel representation in IBM MQ.
     Each channel corresponds to a Queue or Topic within IBM MQ.
@@ -116,7 +118,7 @@ class IbmMqChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class IbmMqMessageBinding(BaseModel):
+class IbmMqMessageBinding(AsyncAPIModel):
     """
     This object contains information about the message representation in IBM MQ.
     """
@@ -164,7 +166,7 @@ class IbmMqMessageBinding(BaseModel):
 
 
 
-class IbmMqServerBinding(BaseModel):
+class IbmMqServerBinding(AsyncAPIModel):
     """
     This document defines how to describe IBM MQ specific information with AsyncAPI.
     """
@@ -1,12 +1,13 @@
 from typing import Optional
 
-from pydantic import AnyUrl, BaseModel, Extra
+from pydantic import AnyUrl, Extra
 
+from .base_model import AsyncAPIModel
 from .contact import Contact
 from .license import License
 
 
-class Info(BaseModel):
+class Info(AsyncAPIModel):
     """
     The object provides metadata about the API. The metadata can be used by the clients if needed.
     """
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class JmsChannelBinding(BaseModel):
+
+class JmsChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe JMS-specific information on AsyncAPI.
 
@@ -13,7 +15,7 @@ class JmsChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class JmsMessageBinding(BaseModel):
+class JmsMessageBinding(AsyncAPIModel):
     """
     This document defines how to describe JMS-specific information on AsyncAPI.
 
@@ -25,7 +27,7 @@ class JmsMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class JmsOperationBinding(BaseModel):
+class JmsOperationBinding(AsyncAPIModel):
     """
     This document defines how to describe JMS-specific information on AsyncAPI.
 
@@ -37,7 +39,7 @@ class JmsOperationBinding(BaseModel):
         extra = Extra.forbid
 
 
-class JmsServerBinding(BaseModel):
+class JmsServerBinding(AsyncAPIModel):
     """
     This document defines how to describe JMS-specific information on AsyncAPI.
 
@@ -21,7 +21,10 @@ from typing import (
 )
 from urllib.parse import ParseResult
 from warnings import warn
-from pydantic import BaseModel, Field, root_validator, validator
+from pydantic import Field, root_validator, validator
+
+from .base_model import AsyncAPIModel
+from .schema_tree import build_schema_tree
 
 SPECIAL_PATH_FORMAT: str = '#-special-path-#-{}-#-special-#'
 
@@ -99,7 +102,7 @@ class JSONReference(_enum.Enum):
     URL = 'URL'
 
 
-class JsonSchemaObject(BaseModel):
+class JsonSchemaObject(AsyncAPIModel):
     __constraint_fields__: Set[str] = {
         'exclusiveMinimum',
         'minimum',
@@ -113,6 +116,16 @@ class JsonSchemaObject(BaseModel):
         'pattern',
     }
     __extra_key__: str = SPECIAL_PATH_FORMAT.format('extras')
+    __memoize_subtrees__ = True
+    __nested_schema_fields__: Dict[str, str] = {
+        'items': 'items',
+        'additionalProperties': 'schema',
+        'patternProperties': 'map',
+        'oneOf': 'list',
+        'anyOf': 'list',
+        'allOf': 'list',
+        'properties': 'map',
+    }
 
     @root_validator(pre=True)
     def validate_exclusive_maximum_and_exclusive_minimum(
@@ -184,7 +197,63 @@ class JsonSchemaObject(BaseModel):
 
     def __init__(self, **data: Any) -> None:  # type: ignore
         super().__init__(**data)
-        self.extras = {k: v for k, v in data.items() if k not in EXCLUDE_FIELD_KEYS}
+        # Set like an assignment would, without its overhead: this runs for every schema node.
+        # Most nodes have no extras: they get an empty dict on first use, see __getattr__
+        extras = get_extras(data)
+        if extras:
+            self.__dict__['extras'] = extras
+        else:
+            del self.__dict__['extras']
+        self.__fields_set__.add('extras')
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when the attribute isn't found
+        if name != 'extras':
+            raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {name!r}')
+        return self._add_empty_extras()
+
+    def _add_empty_extras(self) -> Dict[str, Any]:
+        # At the position of the field, as dict() and json() output the fields in __dict__ order.
+        # __dict__ is updated in place: walkers of the model tree hold on to it
+        values = self.__dict__
+        following = [(name, values.pop(name)) for name in list(values)[list(self.__fields__).index('extras'):]]
+        extras = values['extras'] = {}
+        values.update(following)
+        return extras
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == 'extras' and 'extras' not in self.__dict__:
+            self._add_empty_extras()
+        super().__setattr__(name, value)
+
+    def _iter(self, *args: Any, **kwargs: Any) -> Any:
+        if 'extras' not in self.__dict__:
+            self._add_empty_extras()
+        return super()._iter(*args, **kwargs)
+
+    def __repr_args__(self) -> Any:
+        if 'extras' not in self.__dict__:
+            self._add_empty_extras()
+        return super().__repr_args__()
+
+    @classmethod
+    def _validate(cls, value: Any) -> 'JsonSchemaObject':
+        # Payload schemas can be nested deeper than the recursion limit allows
+        if isinstance(value, dict):
+            return build_schema_tree(cls, value, JsonSchemaObject)
+        return super()._validate(value)
+
+    @classmethod
+    def _prepare_trusted(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        # Applies the validators and __init__ above to the data of construct_trusted
+        extras = get_extras(data)
+        data = cls.validate_exclusive_maximum_and_exclusive_minimum(dict(data))
+        if data.get('$ref') is not None:
+            data['$ref'] = cls.validate_ref(data['$ref'])
+        if 'items' in data:
+            data['items'] = cls.validate_items(data['items'])
+        data[cls.__extra_key__] = extras
+        return data
 
     @cached_property
     def is_object(self) -> bool:
@@ -250,6 +319,13 @@ EXCLUDE_FIELD_KEYS = (set(JsonSchemaObject.__fields__) - DEFAULT_FIELD_KEYS) | {
     JsonSchemaObject.__extra_key__,
 }
 
+
+def get_extras(data: Dict[str, Any]) -> Dict[str, Any]:
+    # Most schema nodes have no extras: checking that costs a set comparison
+    if data.keys() <= EXCLUDE_FIELD_KEYS:
+        return {}
+    return {k: v for k, v in data.items() if k not in EXCLUDE_FIELD_KEYS}
+
 """
 @snooper_to_methods(max_variable_length=None)
 class JsonSchemaParser(Parser):
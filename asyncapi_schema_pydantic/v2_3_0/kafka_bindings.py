@@ -1,11 +1,12 @@
 from typing import Optional
 from enum import Enum
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 from .schema import Schema
 
 
-class KafkaChannelBinding(BaseModel):
+class KafkaChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe Kafka-specific information on AsyncAPI.
 
@@ -17,7 +18,7 @@ class KafkaChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class KafkaMessageBinding(BaseModel):
+class KafkaMessageBinding(AsyncAPIModel):
     """
     This object contains information about the message representation in Kafka.
     """
@@ -37,7 +38,7 @@ class KafkaMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class KafkaServerBinding(BaseModel):
+class KafkaServerBinding(AsyncAPIModel):
     """
     This document defines how to describe Kafka-specific information on AsyncAPI.
 
@@ -48,7 +49,7 @@ class KafkaServerBinding(BaseModel):
         extra = Extra.forbid
 
 
-class KafkaOperationBinding(BaseModel):
+class KafkaOperationBinding(AsyncAPIModel):
     """
     This document defines how to describe Kafka-specific information on AsyncAPI.
     """
@@ -0,0 +1,238 @@
+import threading
+
+from pydantic import BaseModel, PrivateAttr, ValidationError
+
+from .base_model import validated_protocols, validating_protocols
+from .components import Components
+from .json_schema import JsonSchemaObject
+from .ref_resolver import RefResolutionError, pointer_tokens
+from .reference import Reference
+
+COMPONENTS_POINTER = "#/components/"
+
+
+class LazyReference(Reference):
+    """
+    A ``Reference`` to a component which resolves, and validates, its target only on first
+    access. Attributes that are not part of the reference itself are read from the target,
+    so ``operation.message.payload`` works whether ``message`` is inline or referenced.
+    """
+
+    _resolver = PrivateAttr(None)
+
+    def resolve(self):
+        """Return the validated object this reference points to."""
+        return self._resolver.resolve(self.ref)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+
+def validate_mapping_item(model, name, key, value):
+    """Validate a single key and value of the mapping field ``name`` of ``model``."""
+    field = model.__fields__[name]
+    loc = (field.alias, key)
+    _, errors = field.key_field.validate(key, {}, loc=loc)
+    if not errors:
+        value, errors = field.sub_fields[0].validate(value, {}, loc=loc)
+    if errors:
+        raise ValidationError([errors], model)
+    return value
+
+
+class LazyModelDict(dict):
+    """
+    A mapping holding raw values, each one validated against the ``name`` field of ``model``
+    on first access and then cached in place. Iterating over the values or items validates
+    all of them, as does ``validate_all``.
+
+    When a ``ComponentResolver`` is given, the component references of the validated values
+    are replaced with ``LazyReference`` proxies. Values are validated with the protocols of the
+    ``validating_protocols()`` context the mapping was created in.
+    """
+
+    def __init__(self, data, model, name, resolver=None):
+        super().__init__(data)
+        self.model = model
+        self.name = name
+        self.resolver = resolver
+        self.validated = set()
+        self.protocols = validated_protocols()
+        self._lock = threading.RLock()
+
+    @property
+    def field(self):
+        return self.model.__fields__[self.name]
+
+    def __getitem__(self, key):
+        if key not in self.validated:
+            return self.validate(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.validated.add(key)
+
+    def validate(self, key):
+        """Validate the raw value of ``key``, unless already done, and return the validated one."""
+        with self._lock:
+            value = super().__getitem__(key)
+            if key in self.validated:
+                return value
+            with validating_protocols(self.protocols):
+                value = validate_mapping_item(self.model, self.name, key, value)
+            if self.resolver is not None:
+                value = self.resolver.attach(value)
+            self[key] = value
+            return value
+
+    def validate_all(self):
+        """Validate every value, raising a single ``ValidationError`` with all the errors found."""
+        errors = []
+        for key in self:
+            try:
+                self[key]
+            except ValidationError as e:
+                errors.extend(e.raw_errors)
+        if errors:
+            raise ValidationError(errors, self.model)
+
+    def __iter__(self):
+        # Overriding __iter__ turns off CPython's fast path copying a dict's raw values, so that
+        # dict(mapping) and {**mapping} read every value through __getitem__, validating it
+        return super().__iter__()
+
+    def keys(self):
+        return super().keys()
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def copy(self):
+        return dict(self.items())
+
+    def __reduce__(self):
+        # Pickle the raw and validated values as they are, without validating the rest
+        state = {"validated": self.validated, "protocols": self.protocols}
+        return type(self), (dict(super().items()), self.model, self.name, self.resolver), state
+
+
+class ComponentResolver:
+    """
+    Resolves references to the components of a document, which are validated on demand.
+
+    Every component is validated at most once: the references to it and the lazy
+    ``Components`` mappings all share the same validated object. The internal references
+    of validated objects are in turn replaced with ``LazyReference`` proxies.
+    """
+
+    def __init__(self, data):
+        sections = {}
+        for name, field in Components.__fields__.items():
+            section = data.get(field.alias)
+            if section is not None:
+                sections[name] = LazyModelDict(section, Components, name, self)
+        self.components = Components.construct(**sections)
+
+    def resolve(self, ref):
+        seen = set()
+        while True:
+            if ref in seen:
+                raise RefResolutionError(f"Circular $ref '{ref}'")
+            seen.add(ref)
+            tokens = pointer_tokens(ref[len(COMPONENTS_POINTER) - 1:])
+            section = getattr(self.components, tokens[0], None) if len(tokens) == 2 else None
+            if not isinstance(section, LazyModelDict) or tokens[1] not in section:
+                raise RefResolutionError(f"Can't resolve $ref '{ref}'")
+            target = section[tokens[1]]
+            if not isinstance(target, Reference) or not is_component_ref(target.ref):
+                return target
+            ref = target.ref
+
+    def attach(self, value):
+        """
+        Replace, in place, the component references within ``value`` with lazy proxies: the
+        ``Reference`` objects, and the schemas that only hold a ``$ref`` (e.g. ``payload``).
+        """
+        if is_reference(value):
+            return self.proxy(value)
+        stack = [value]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, BaseModel):
+                container = node.__dict__
+                items = [(name, container.get(name)) for name in node.__fields__]
+            elif isinstance(node, dict) and not isinstance(node, LazyModelDict):
+                container = node
+                items = list(node.items())
+            elif isinstance(node, list):
+                container = node
+                items = list(enumerate(node))
+            else:
+                continue
+            for key, item in items:
+                if is_reference(item):
+                    container[key] = self.proxy(item)
+                elif isinstance(item, (BaseModel, dict, list)):
+                    stack.append(item)
+        return value
+
+    def proxy(self, reference):
+        if isinstance(reference, LazyReference) or not is_component_ref(reference.ref):
+            return reference
+        proxy = LazyReference(**{"$ref": reference.ref})
+        proxy._resolver = self
+        return proxy
+
+
+def is_reference(value):
+    if isinstance(value, JsonSchemaObject):
+        return value.ref is not None and not value.extras and value.__fields_set__ <= {"ref", "extras"}
+    return isinstance(value, Reference)
+
+
+def is_component_ref(ref):
+    return ref.startswith(COMPONENTS_POINTER)
+
+
+def parse_lazily(model_class, data, references=True, channels=False):
+    """
+    Validate ``data`` as ``model_class``, deferring the validation of parts of it to first access.
+
+    With ``references``, components are validated on first access and references to them
+    become ``LazyReference`` proxies. With ``channels``, each channel item is validated on
+    first access; ``document.channels.validate_all()`` validates the remaining ones.
+    """
+    components = data.get("components") if references else None
+    if not isinstance(components, dict):
+        components = None
+    raw_channels = data.get("channels") if channels else None
+    if not isinstance(raw_channels, dict):
+        raw_channels = None
+    if components is None and raw_channels is None:
+        return model_class.parse_obj(data)
+
+    deferred = {}
+    if components is not None:
+        deferred["components"] = None
+    if raw_channels is not None:
+        deferred["channels"] = {}
+    document = model_class.parse_obj({**data, **deferred})
+
+    resolver = None
+    if components is not None:
+        resolver = ComponentResolver(components)
+        resolver.attach(document)
+        document.__dict__["components"] = resolver.components
+        document.__fields_set__.add("components")
+    if raw_channels is not None:
+        document.__dict__["channels"] = LazyModelDict(raw_channels, model_class, "channels", resolver)
+    return document
@@ -0,0 +1,128 @@
+import json
+import mmap
+import os
+import re
+
+import yaml
+
+try:
+    # LibYAML bindings are an order of magnitude faster than the pure-Python loader
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+JSON_DOCUMENT_START = re.compile(rb"\s*[{\[]")
+JSON_TEXT_START = re.compile(r"\s*[{\[]")
+
+MMAP_THRESHOLD = 1 << 20
+"""
+Files of at least this size are parsed from a read-only memory map instead of being read into memory.
+"""
+
+
+def looks_like_json(content):
+    return (JSON_TEXT_START if isinstance(content, str) else JSON_DOCUMENT_START).match(content) is not None
+
+
+def load_json(content):
+    # With orjson, integers that don't fit in 64 bits are parsed as floats
+    if orjson is not None:
+        try:
+            # orjson parses buffers, e.g. a memory map, without copying them
+            return orjson.loads(content if isinstance(content, (str, bytes)) else memoryview(content))
+        except ValueError:
+            # The json module also accepts NaN and Infinity: let it decide
+            pass
+    return json.loads(content if isinstance(content, (str, bytes, bytearray)) else bytes(content))
+
+
+def load_yaml(content):
+    if isinstance(content, (bytearray, memoryview)):
+        content = bytes(content)
+    # A memory map is parsed as a stream, chunk by chunk, without copying it
+    return yaml.load(content, Loader=YamlLoader)
+
+
+def load_toml(content):
+    if tomllib is None:
+        raise ValueError("Loading TOML documents requires Python 3.11 or the tomli package")
+    if not isinstance(content, str):
+        content = bytes(content).decode("utf-8")
+    return tomllib.loads(content)
+
+
+class DocumentLoaders:
+    """
+    Registry of the functions parsing documents into Python objects, chosen by file extension and
+    by content. A loader is called with the content of a document, as ``str``, ``bytes`` or a
+    read-only memory map.
+
+    Loaders registered with a ``sniff`` function are tried first on the documents it accepts,
+    falling back to the loader of the file extension (or the default one) when they raise a
+    ``ValueError``: that is how YAML documents whose content is JSON are parsed by the much
+    faster JSON loader.
+    """
+
+    def __init__(self, default=None):
+        self.default = default
+        self._by_extension = {}
+        self._sniffers = []
+
+    def register(self, loader, extensions=(), sniff=None):
+        for extension in extensions:
+            self._by_extension[extension.lower()] = loader
+        if sniff is not None:
+            self._sniffers.append((sniff, loader))
+
+    @property
+    def extensions(self):
+        return tuple(self._by_extension)
+
+    def loader_for(self, filename):
+        """Return the loader of the extension of ``filename``, or the default one."""
+        _, extension = os.path.splitext(os.fspath(filename))
+        return self._by_extension.get(extension.lower(), self.default)
+
+    def load(self, content, filename=None):
+        """Parse ``content``, using the loader of the extension of ``filename`` when given."""
+        loader = self.loader_for(filename) if filename is not None else self.default
+        for sniff, sniffed_loader in self._sniffers:
+            if sniffed_loader is not loader and sniff(content):
+                try:
+                    return sniffed_loader(content)
+                except ValueError:
+                    pass
+        if loader is None:
+            raise ValueError(f"No loader for {filename}")
+        return loader(content)
+
+    def load_file(self, filename):
+        """Parse the file ``filename``. Large files are mapped in memory rather than read."""
+        with open(filename, "rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                return self.load(f.read(), filename)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return self.load(content, filename)
+
+
+document_loaders = DocumentLoaders(default=load_yaml)
+"""
+The loaders used to read AsyncAPI documents and the files they reference. Registering a loader
+for a new extension also makes ``$ref`` to files with that extension external references.
+"""
+document_loaders.register(load_json, (".json",), sniff=looks_like_json)
+document_loaders.register(load_yaml, (".yaml", ".yml"))
+document_loaders.register(load_toml, (".toml",))
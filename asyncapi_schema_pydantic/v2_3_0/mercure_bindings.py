@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class MercureChannelBinding(BaseModel):
+
+class MercureChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe Mercure-specific information on AsyncAPI.
 
@@ -13,7 +15,7 @@ class MercureChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class MercureMessageBinding(BaseModel):
+class MercureMessageBinding(AsyncAPIModel):
     """
     This document defines how to describe Mercure-specific information on AsyncAPI.
 
@@ -25,7 +27,7 @@ class MercureMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class MercureOperationBinding(BaseModel):
+class MercureOperationBinding(AsyncAPIModel):
     """
     This document defines how to describe Mercure-specific information on AsyncAPI.
 
@@ -37,7 +39,7 @@ class MercureOperationBinding(BaseModel):
         extra = Extra.forbid
 
 
-class MercureServerBinding(BaseModel):
+class MercureServerBinding(AsyncAPIModel):
     """
     This document defines how to describe Mercure-specific information on AsyncAPI.
 
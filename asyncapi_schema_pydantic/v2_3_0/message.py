@@ -1,8 +1,9 @@
 from typing import List, Optional, Union
 
-from pydantic import BaseModel, Field, Extra
+from pydantic import Field, Extra
 
-from .reference import Reference
+from .base_model import AsyncAPIModel
+from .reference import Reference, reference_dispatcher
 from .tag import Tag
 from .external_documentation import ExternalDocumentation
 from .schema import Schema
@@ -12,11 +13,13 @@ from .message_example import MessageExample
 from .correlation_id import CorrelationId
 
 
-class Message(BaseModel):
+class Message(AsyncAPIModel):
     """
     Describes a message received on a given channel and operation.
     """
 
+    __memoize_subtrees__ = True
+
     headers: Optional[Union[Schema, Reference]] = None
     """
     Schema definition of the application headers. Schema MUST be of type "object".
@@ -106,9 +109,13 @@ class Message(BaseModel):
     here. The resulting object MUST be a valid Message Object.
     """
 
+    _dispatch_references = reference_dispatcher("correlationId", "bindings")
+    _dispatch_reference_items = reference_dispatcher("traits", each_item=True)
+
 
     class Config:
         extra = Extra.forbid
+        smart_union = True
         schema_extra = {
             "examples": [
                             {
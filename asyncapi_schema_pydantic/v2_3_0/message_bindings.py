@@ -1,7 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .bindings import BindingsModel
 from .http_bindings import HttpMessageBinding
 from .web_sockets_bindings import WebSocketsMessageBinding
 from .kafka_bindings import KafkaMessageBinding
@@ -20,11 +21,13 @@ from .redis_bindings import RedisMessageBinding
 from .mercure_bindings import MercureMessageBinding
 from .ibm_mq_bindings import IbmMqMessageBinding
 
-class MessageBindings(BaseModel):
+class MessageBindings(BindingsModel):
     """
     Map describing protocol-specific definitions for a message.
     """
 
+    __memoize_subtrees__ = True
+
     http: Optional[HttpMessageBinding] = None
     """
     Protocol-specific information for an HTTP message, i.e., a request or a response.
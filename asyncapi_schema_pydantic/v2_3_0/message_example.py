@@ -1,12 +1,13 @@
 from typing import Optional, Dict, Union
 
-from pydantic import BaseModel, Extra, Field
+from pydantic import Extra, Field
 
+from .base_model import AsyncAPIModel
 from .reference import Reference
 from .schema import Schema
 
 
-class MessageExample(BaseModel):
+class MessageExample(AsyncAPIModel):
     """
     Message Example Object represents an example of a Message Object and MUST
     contain either headers and/or payload fields.
@@ -57,7 +58,7 @@ class MessageExample(BaseModel):
         }
 
 
-class IbmMqServerBinding(BaseModel):
+class IbmMqServerBinding(AsyncAPIModel):
     """
     This document defines how to describe IBM MQ specific information with AsyncAPI.
     """
@@ -1,8 +1,9 @@
 from typing import List, Optional, Union
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
-from .reference import Reference
+from .base_model import AsyncAPIModel
+from .reference import Reference, reference_dispatcher
 from .tag import Tag
 from .external_documentation import ExternalDocumentation
 from .schema import Schema
@@ -11,7 +12,7 @@ from .message_example import MessageExample
 from .correlation_id import CorrelationId
 
 
-class MessageTrait(BaseModel):
+class MessageTrait(AsyncAPIModel):
     """
     Describes a trait that MAY be applied to a Message Object. This object MAY contain
     any property from the Message Object, except payload and traits.
@@ -19,6 +20,8 @@ class MessageTrait(BaseModel):
     If you're looking to apply traits to an operation, see the Operation Trait Object.
     """
 
+    __memoize_subtrees__ = True
+
     headers: Optional[Union[Schema, Reference]] = None
     """
     Schema definition of the application headers. Schema MUST be of type "object". It
@@ -86,9 +89,12 @@ class MessageTrait(BaseModel):
     List of examples.
     """
 
+    _dispatch_references = reference_dispatcher("correlationId", "bindings")
+
 
     class Config:
         extra = Extra.forbid
+        smart_union = True
         schema_extra = {
             "examples": [
                             {
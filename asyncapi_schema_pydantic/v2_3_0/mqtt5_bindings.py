@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class Mqtt5ChannelBinding(BaseModel):
+
+class Mqtt5ChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe MQTT 5-specific information on AsyncAPI.
 
@@ -13,7 +15,7 @@ class Mqtt5ChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class Mqtt5MessageBinding(BaseModel):
+class Mqtt5MessageBinding(AsyncAPIModel):
     """
     This document defines how to describe MQTT 5-specific information on AsyncAPI.
 
@@ -25,7 +27,7 @@ class Mqtt5MessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class Mqtt5OperationBinding(BaseModel):
+class Mqtt5OperationBinding(AsyncAPIModel):
     """
     This document defines how to describe MQTT 5-specific information on AsyncAPI.
 
@@ -37,7 +39,7 @@ class Mqtt5OperationBinding(BaseModel):
         extra = Extra.forbid
 
 
-class Mqtt5ServerBinding(BaseModel):
+class Mqtt5ServerBinding(AsyncAPIModel):
     """
     This document defines how to describe MQTT 5-specific information on AsyncAPI.
 
@@ -1,9 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class MqttChannelBinding(BaseModel):
+
+class MqttChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe MQTT-specific information on AsyncAPI.
 
@@ -14,7 +16,7 @@ class MqttChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class MqttMessageBinding(BaseModel):
+class MqttMessageBinding(AsyncAPIModel):
     """
     This object contains information about the message representation in MQTT.
     """
@@ -29,7 +31,7 @@ class MqttMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class MqttOperationBinding(BaseModel):
+class MqttOperationBinding(AsyncAPIModel):
     """
     This object contains information about the operation representation in MQTT.
     """
@@ -75,7 +77,7 @@ class MqttOperationBinding(BaseModel):
         }
 
 
-class MqttLastWill(BaseModel):
+class MqttLastWill(AsyncAPIModel):
     """
     Last Will and Testament configuration.
     """
@@ -105,7 +107,7 @@ class MqttLastWill(BaseModel):
         extra = Extra.forbid
 
 
-class MqttServerBinding(BaseModel):
+class MqttServerBinding(AsyncAPIModel):
     """
     This document defines how to describe MQTT-specific information on AsyncAPI.
     """
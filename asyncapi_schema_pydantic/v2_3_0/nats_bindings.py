@@ -1,9 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class NatsChannelBinding(BaseModel):
+
+class NatsChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe NATS-specific information on AsyncAPI.
 
@@ -15,7 +17,7 @@ class NatsChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class NatsMessageBinding(BaseModel):
+class NatsMessageBinding(AsyncAPIModel):
     """
     This document defines how to describe NATS-specific information on AsyncAPI.
 
@@ -27,7 +29,7 @@ class NatsMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class NatsOperationBinding(BaseModel):
+class NatsOperationBinding(AsyncAPIModel):
     """
     This document defines how to describe NATS-specific information on AsyncAPI.
     """
@@ -47,7 +49,7 @@ class NatsOperationBinding(BaseModel):
         extra = Extra.forbid
 
 
-class NatsServerBinding(BaseModel):
+class NatsServerBinding(AsyncAPIModel):
     """
     This document defines how to describe NATS-specific information on AsyncAPI.
 
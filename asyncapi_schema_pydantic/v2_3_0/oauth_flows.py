@@ -1,9 +1,11 @@
 from typing import Optional, Dict
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class OAuthFlow(BaseModel):
+
+class OAuthFlow(AsyncAPIModel):
     """
     Configuration details for a supported OAuth Flow.
     """
@@ -58,7 +60,7 @@ class OAuthFlow(BaseModel):
                     }
 
 
-class OAuthFlows(BaseModel):
+class OAuthFlows(AsyncAPIModel):
     """
     Allows configuration of the supported OAuth Flows.
     """
@@ -1,8 +1,9 @@
 from typing import Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, Extra
+from pydantic import Field, Extra
 
-from .reference import Reference
+from .base_model import AsyncAPIModel
+from .reference import Reference, reference_dispatcher
 from .operation_bindings import OperationBindings
 from .tag import Tag
 from .external_documentation import ExternalDocumentation
@@ -11,7 +12,7 @@ from .operation_trait import OperationTrait
 from .message import Message
 
 
-class Operation(BaseModel):
+class Operation(AsyncAPIModel):
     """Describes a publish or a subscribe operation. This provides a place to document
     how and why messages are sent and received.
 
@@ -70,9 +71,13 @@ class Operation(BaseModel):
     However, a message MUST be valid only against one of the message objects.
     """
 
+    _dispatch_references = reference_dispatcher("bindings", "message")
+    _dispatch_reference_items = reference_dispatcher("traits", each_item=True)
+
 
     class Config:
         extra = Extra.forbid
+        smart_union = True
         schema_extra = {
             "examples": [
                             {
@@ -1,7 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .bindings import BindingsModel
 from .http_bindings import HttpOperationBinding
 from .web_sockets_bindings import WebSocketsOperationBinding
 from .kafka_bindings import KafkaOperationBinding
@@ -20,11 +21,13 @@ from .redis_bindings import RedisOperationBinding
 from .mercure_bindings import MercureOperationBinding
 
 
-class OperationBindings(BaseModel):
+class OperationBindings(BindingsModel):
     """
     Map describing protocol-specific definitions for a operation.
     """
 
+    __memoize_subtrees__ = True
+
     http: Optional[HttpOperationBinding] = None
     """
     Protocol-specific information for an HTTP operation.
@@ -1,14 +1,15 @@
 from typing import List, Optional, Union
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 from .operation_bindings import OperationBindings
 from .external_documentation import ExternalDocumentation
-from .reference import Reference
+from .reference import Reference, reference_dispatcher
 from .tag import Tag
 
 
-class OperationTrait(BaseModel):
+class OperationTrait(AsyncAPIModel):
     """
     Describes a trait that MAY be applied to an Operation Object. This object MAY contain any
     property from the Operation Object, except message and traits.
@@ -48,9 +49,12 @@ class OperationTrait(BaseModel):
     definitions for the operation.
     """
 
+    _dispatch_references = reference_dispatcher("bindings")
+
 
     class Config:
         extra = Extra.forbid
+        smart_union = True
         schema_extra = {
             "examples": [
                 {
@@ -1,7 +1,8 @@
 from typing import Optional, Union
 
-from pydantic import BaseModel, Extra, Field, constr
+from pydantic import Extra, Field, constr
 
+from .base_model import AsyncAPIModel
 from .reference import Reference
 from .schema import Schema
 
@@ -9,7 +10,7 @@ from .schema import Schema
 ParameterName = constr(regex=r"^[A-Za-z0-9_\-]+$")
 
 
-class Parameter(BaseModel):
+class Parameter(AsyncAPIModel):
     """Describes a parameter included in a channel name."""
 
     description: Optional[str] = None
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class RedisChannelBinding(BaseModel):
+
+class RedisChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe Redis-specific information on AsyncAPI.
 
@@ -13,7 +15,7 @@ class RedisChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class RedisMessageBinding(BaseModel):
+class RedisMessageBinding(AsyncAPIModel):
     """
     This document defines how to describe Redis-specific information on AsyncAPI.
 
@@ -25,7 +27,7 @@ class RedisMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class RedisOperationBinding(BaseModel):
+class RedisOperationBinding(AsyncAPIModel):
     """
     This document defines how to describe Redis-specific information on AsyncAPI.
 
@@ -37,7 +39,7 @@ class RedisOperationBinding(BaseModel):
         extra = Extra.forbid
 
 
-class RedisServerBinding(BaseModel):
+class RedisServerBinding(AsyncAPIModel):
     """
     This document defines how to describe Redis-specific information on AsyncAPI.
 
@@ -0,0 +1,381 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Optional
+from urllib.parse import unquote
+
+from pydantic import BaseModel, Extra
+
+from .file_cache import normalize_path
+from .loaders import document_loaders
+
+
+class RefResolutionError(ValueError):
+    """Raised when a ``$ref`` can't be resolved."""
+
+
+class RefCycleError(RefResolutionError):
+    """Raised when external references form a cycle. ``cycle`` lists the refs involved, in order."""
+
+    def __init__(self, cycle: List[str]):
+        super().__init__("Circular $ref: " + " -> ".join(cycle))
+        self.cycle = cycle
+
+
+class RefBudgetExceededError(RefResolutionError):
+    """Raised when resolving the references of a document exceeds one of its ``ResolutionLimits``."""
+
+
+class ResolutionLimits(BaseModel):
+    """
+    Bounds on the work done to resolve the external references of a single document, so that a
+    malicious or broken document can't use unbounded CPU and memory. ``None`` means no limit.
+    """
+
+    max_depth: Optional[int] = None
+    """
+    Maximum nesting of references, i.e. of files referencing files referencing files.
+    """
+
+    max_nodes: Optional[int] = None
+    """
+    Maximum number of nodes (mappings, sequences and scalars) inlined into the document in total.
+    A file referenced twice is counted twice, which bounds the combinatorial expansion of shared
+    references.
+    """
+
+    max_bytes: Optional[int] = None
+    """
+    Maximum number of bytes of referenced files read in total.
+    """
+
+    class Config:
+        extra = Extra.forbid
+
+
+def split_ref(ref):
+    """Split ``file.yaml#/json/pointer`` into its file and JSON pointer fragment parts."""
+    file_part, _, fragment = ref.partition("#")
+    return file_part, fragment
+
+
+def is_external_ref(value):
+    if not isinstance(value, str) or value.startswith("#") or "://" in value:
+        return False
+    return split_ref(value)[0].lower().endswith(document_loaders.extensions)
+
+
+def is_local_ref(value):
+    return isinstance(value, str) and value.startswith("#")
+
+
+def pointer_tokens(fragment):
+    """
+    Return the unescaped reference tokens of a JSON pointer fragment (RFC 6901): ``''`` is the
+    whole document and ``/a~1b/`` the empty-named member of the ``a/b`` member.
+    """
+    fragment = unquote(fragment)
+    if not fragment:
+        return []
+    if not fragment.startswith("/"):
+        raise RefResolutionError(f"Invalid JSON pointer '{fragment}'")
+    return [token.replace("~1", "/").replace("~0", "~") for token in fragment[1:].split("/")]
+
+
+PENDING = object()
+
+
+class ResolveFrame:
+    """
+    A container being resolved by ``RefResolver.resolve``, or the reference whose target is
+    being resolved, with ``data`` None.
+    """
+
+    __slots__ = ("data", "base", "keys", "index", "resolved", "ref", "key")
+
+    def __init__(self, data, base, ref=None, key=None):
+        self.data = data
+        self.base = base
+        self.keys = () if data is None else list(data) if isinstance(data, dict) else range(len(data))
+        self.index = 0
+        # The copy of data holding the resolved values, made once one of them differs
+        self.resolved = None
+        self.ref = ref
+        self.key = key
+
+    def set_child(self, value):
+        key = self.keys[self.index]
+        self.index += 1
+        if value is not self.data[key]:
+            if self.resolved is None:
+                self.resolved = self.data.copy()
+            self.resolved[key] = value
+
+
+class RefResolver:
+    """
+    Inlines the external file references of an AsyncAPI document, either to a whole file
+    (``$ref: 'file.yaml'``) or to a node inside it (``$ref: 'file.yaml#/path/to/node'``).
+    Files of every extension of ``document_loaders`` are supported: YAML (``.yaml``, ``.yml``),
+    JSON (``.json``) and TOML (``.toml``) by default.
+
+    References are relative to the file they are in. Inside a referenced file, local references
+    (``$ref: '#/path/to/node'``) to a node of that file are inlined as well, while the ones it
+    doesn't hold are kept: they point into the root document, e.g. ``#/components/...``. Local
+    references to a node being inlined, i.e. recursive schemas, are kept too.
+
+    Every referenced file is loaded once per resolver, keyed on its normalized absolute path,
+    and every referenced node is resolved once, keyed on its file and pointer: repeated
+    references share the same resolved tree and repeated fragment lookups are constant-time.
+    When a ``FileCache`` is given, parsed files are also reused across resolvers.
+
+    The input data is never modified: containers holding a resolved reference are copied.
+
+    With ``max_workers``, ``prefetch`` reads and parses all the transitively referenced files
+    concurrently on a thread pool before they are stitched in, which hides the latency of
+    slow (e.g. network) filesystems. The resolved output is the same as the serial one.
+
+    Cycles between files raise a ``RefCycleError`` reporting the cycle, and ``limits`` bound the
+    work done for a single document (see ``ResolutionLimits``).
+    """
+
+    def __init__(self, files_folder, loader, file_cache=None, max_workers=None, limits=None):
+        self.files_folder = files_folder
+        self.loader = loader
+        self.file_cache = file_cache
+        self.max_workers = max_workers
+        self.limits = limits or ResolutionLimits()
+        self.documents = {}
+        self.resolved = {}
+        self.bytes_read = 0
+        self.inlined_nodes = 0
+        self._stack = []
+        self._active = {}
+        self._node_counts = {}
+        self._lock = threading.Lock()
+
+    def resolve_document(self, data):
+        if self.max_workers:
+            self.prefetch(data)
+        return self.resolve(data)
+
+    def resolve(self, data, base=None):
+        """
+        Return ``data`` with its references inlined. ``base`` is the path of the file holding
+        ``data``, or None for the root document, whose references are relative to ``files_folder``.
+
+        Walks the data with an explicit stack rather than recursion, so the depth of the
+        documents is not limited by the recursion limit.
+        """
+        stack = []
+        try:
+            value = self.enter(data, base, stack)
+            while stack:
+                frame = stack[-1]
+                if value is not PENDING:
+                    if frame.ref is not None:
+                        # The target of a reference is resolved
+                        stack.pop()
+                        value = self.inlined(frame, value)
+                        continue
+                    frame.set_child(value)
+                if frame.index < len(frame.keys):
+                    value = self.enter(frame.data[frame.keys[frame.index]], frame.base, stack)
+                    continue
+                stack.pop()
+                value = frame.data if frame.resolved is None else frame.resolved
+        except BaseException:
+            for frame in stack:
+                if frame.ref is not None:
+                    self._stack.pop()
+                    del self._active[frame.key]
+            raise
+        return value
+
+    def enter(self, value, base, stack):
+        """
+        Return ``value`` resolved if it needs no further work, or push the frames resolving it
+        onto ``stack`` and return ``PENDING``.
+        """
+        # The references followed to get to value, which only alias each other
+        aliases = set()
+        while isinstance(value, dict):
+            ref = value.get("$ref")
+            if not (is_external_ref(ref) or base is not None and is_local_ref(ref) and self.holds(base, ref[1:])):
+                break
+            # The whole node is replaced by the referenced one, sibling keys included
+            file_part, fragment = split_ref(ref)
+            path = self.ref_path(file_part, base) if file_part else base
+            tokens = pointer_tokens(fragment)
+            key = (path, tuple(tokens))
+            if key in self.resolved:
+                return self.counted(ref, self.resolved[key])
+            if key in self._active:
+                if not file_part and key not in aliases:
+                    # A recursive schema: inlining the node into itself would never end
+                    break
+                raise RefCycleError(self._stack[self._active[key]:] + [ref])
+            max_depth = self.limits.max_depth
+            if max_depth is not None and len(self._stack) >= max_depth:
+                raise RefBudgetExceededError(
+                    f"$ref nesting deeper than {max_depth}: " + " -> ".join(self._stack + [ref])
+                )
+            value, base = self.lookup(path, tokens, ref), path
+            aliases.add(key)
+            self._active[key] = len(self._stack)
+            self._stack.append(ref)
+            stack.append(ResolveFrame(None, base, ref, key))
+
+        if isinstance(value, (dict, list)) and value:
+            stack.append(ResolveFrame(value, base))
+            return PENDING
+        return value
+
+    def inlined(self, frame, target):
+        """Record ``target``, the resolved node of the reference of ``frame``, and return it."""
+        self._stack.pop()
+        del self._active[frame.key]
+        self.resolved[frame.key] = target
+        return self.counted(frame.ref, target)
+
+    def counted(self, ref, target):
+        if self.limits.max_nodes is not None and not self._stack:
+            # Only count the outermost references: the node count of their target already
+            # includes everything inlined into it
+            self.inlined_nodes += self.node_count(target)
+            if self.inlined_nodes > self.limits.max_nodes:
+                raise RefBudgetExceededError(
+                    f"More than {self.limits.max_nodes} nodes inlined, exceeded while resolving '{ref}'"
+                )
+        return target
+
+    def node_count(self, data):
+        """Return the number of nodes of ``data`` once expanded, in time linear in its unique nodes."""
+        if not isinstance(data, (dict, list)):
+            return 1
+        counts = self._node_counts
+        visiting = set()
+        stack = [data]
+        while stack:
+            node = stack[-1]
+            if id(node) in counts:
+                stack.pop()
+                continue
+            children = [
+                child for child in (node.values() if isinstance(node, dict) else node)
+                if isinstance(child, (dict, list))
+            ]
+            if id(node) not in visiting:
+                visiting.add(id(node))
+                stack.extend(child for child in children if id(child) not in counts and id(child) not in visiting)
+                continue
+            stack.pop()
+            # A container nested in itself (YAML anchors) is counted once
+            counts[id(node)] = len(node) - len(children) + 1 + sum(counts.get(id(child), 1) for child in children)
+        return counts[id(data)]
+
+    def lookup(self, path, tokens, ref):
+        """Return the raw node at the JSON pointer ``tokens`` of the file at ``path``."""
+        node = self.load_document(path)
+        for token in tokens:
+            try:
+                node = node[int(token)] if isinstance(node, list) else node[token]
+            except (KeyError, IndexError, TypeError, ValueError):
+                raise RefResolutionError(f"Can't resolve $ref '{ref}': '{token}' not found in {path}")
+        return node
+
+    def holds(self, path, fragment):
+        """Whether the file at ``path`` has a node at the JSON pointer ``fragment``."""
+        try:
+            self.lookup(path, pointer_tokens(fragment), fragment)
+        except RefResolutionError:
+            return False
+        return True
+
+    def ref_path(self, file_part, base=None):
+        """The path of the file ``file_part`` referenced from the file ``base`` (None for the root document)."""
+        folder = os.path.dirname(base) if base is not None else self.files_folder
+        return normalize_path(os.path.join(folder, file_part))
+
+    def load_document(self, path):
+        if path not in self.documents:
+            self.documents[path] = self.load_file(path)
+        return self.documents[path]
+
+    def prefetch(self, data):
+        """Load every file transitively referenced by ``data`` on a thread pool."""
+        seen = set(self.documents)
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            pending = {}
+            for path in self.find_external_files(data, seen):
+                pending[executor.submit(self.load_file, path)] = path
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    self.documents[path] = future.result()
+                    for child_path in self.find_external_files(self.documents[path], seen, path):
+                        pending[executor.submit(self.load_file, child_path)] = child_path
+
+    async def aprefetch(self, data, executor=None):
+        """Like ``prefetch``, but loads the files on ``executor`` without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        seen = set(self.documents)
+        paths = await loop.run_in_executor(executor, self.find_external_files, data, seen)
+        while paths:
+            documents = await asyncio.gather(
+                *(loop.run_in_executor(executor, self.load_file, path) for path in paths)
+            )
+            self.documents.update(zip(paths, documents))
+            paths = await loop.run_in_executor(executor, self.find_files_referenced_by, paths, seen)
+
+    def dependencies(self, data):
+        """Return the paths of the files ``data`` references, directly or through other files."""
+        paths = set()
+        pending = self.find_external_files(data, paths)
+        while pending:
+            path = pending.pop()
+            pending.extend(self.find_external_files(self.load_document(path), paths, path))
+        return paths
+
+    def find_files_referenced_by(self, paths, seen):
+        """Return the paths of the files referenced by the loaded files ``paths`` that are not in ``seen`` yet."""
+        found = []
+        for path in paths:
+            found.extend(self.find_external_files(self.documents[path], seen, path))
+        return found
+
+    def find_external_files(self, data, seen, base=None):
+        """
+        Return the paths of the files referenced by ``data``, held by the file ``base`` (None for
+        the root document), that are not in ``seen`` yet.
+        """
+        paths = []
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                ref = node.get("$ref")
+                if is_external_ref(ref):
+                    path = self.ref_path(split_ref(ref)[0], base)
+                    if path not in seen:
+                        seen.add(path)
+                        paths.append(path)
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+        return paths
+
+    def load_file(self, path):
+        max_bytes = self.limits.max_bytes
+        if max_bytes is not None:
+            # Checked before reading, so an oversized file is never loaded
+            size = os.path.getsize(path)
+            with self._lock:
+                self.bytes_read += size
+                if self.bytes_read > max_bytes:
+                    raise RefBudgetExceededError(f"More than {max_bytes} bytes read, exceeded while loading {path}")
+        if self.file_cache is not None:
+            return self.file_cache.load(path, self.loader)
+        return self.loader(path)
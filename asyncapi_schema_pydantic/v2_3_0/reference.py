@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Extra, Field
+from pydantic import BaseModel, Extra, Field, validator
 
+from .base_model import AsyncAPIModel
 
-class Reference(BaseModel):
+
+class Reference(AsyncAPIModel):
     """
     A simple object to allow referencing other components in the specification,
     internally and externally.
@@ -27,3 +29,24 @@ class Reference(BaseModel):
 
     class Config:
         extra = Extra.forbid
+
+
+def dispatch_reference(cls, value, field):
+    if isinstance(value, Reference) or isinstance(value, dict) and "$ref" in value:
+        return Reference.validate(value)
+    if isinstance(value, (dict, BaseModel)):
+        # The model the field holds when it is not a Reference is the first member of the Union
+        return field.sub_fields[0].type_.validate(value)
+    return value
+
+
+def reference_dispatcher(*fields, each_item=False):
+    """
+    Validator of the ``Union[X, Reference]`` ``fields`` (``each_item`` for their items, in lists
+    and dicts), validating a mapping as ``Reference`` when it has a ``$ref`` key and as ``X``
+    otherwise, instead of letting pydantic try ``X`` first and ``Reference`` when that fails.
+    The model must set ``smart_union``, so that the instance built is then kept as it is.
+
+    Not for ``Schema`` unions: ``Schema`` itself accepts ``$ref``, so pydantic never falls back.
+    """
+    return validator(*fields, pre=True, each_item=each_item, allow_reuse=True)(dispatch_reference)
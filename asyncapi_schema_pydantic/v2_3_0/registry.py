@@ -0,0 +1,206 @@
+import os
+import threading
+
+from .file_cache import FileCache, file_signature
+from .reload import ReloadableDocument
+
+try:
+    # Optional: wakes the watcher up as soon as a file changes instead of at the next poll
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+
+class SpecRegistry:
+    """
+    A set of named documents kept up to date with their files by a background thread.
+
+    The thread watches the root file of every document and every file it references: it polls
+    their modification time and size every ``poll_interval`` seconds and, when ``inotify_simple``
+    is installed (Linux), is woken up by inotify as soon as one of them changes. Once a burst of
+    changes has been quiet for ``debounce`` seconds, the affected documents are reloaded (see
+    ``ReloadableDocument``) and the new ones are published by replacing a reference.
+
+    Reading a document never blocks and always returns a complete one: the previous document
+    until its replacement is fully built and validated. A failing reload keeps the previous
+    document, records the error in ``errors`` and is retried when the files change again.
+    """
+
+    def __init__(self, model_class, poll_interval=1.0, debounce=0.25, on_reload=None, on_error=None):
+        self.model_class = model_class
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self.file_cache = FileCache()
+        self.errors = {}
+        self._documents = {}
+        self._handles = {}
+        self._failed = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._inotify = None
+        self._watches = {}
+
+    def add(self, name, filename, limits=None):
+        """Load ``filename`` as the document ``name`` and start watching its files."""
+        handle = ReloadableDocument(self.model_class, filename, self.file_cache, limits)
+        with self._lock:
+            self._handles[name] = handle
+            self._publish(name, handle.document)
+            self._update_watches()
+        return handle.document
+
+    def remove(self, name):
+        with self._lock:
+            del self._handles[name]
+            documents = dict(self._documents)
+            del documents[name]
+            self._documents = documents
+            self.errors.pop(name, None)
+            self._failed.pop(name, None)
+            self._update_watches()
+
+    def __getitem__(self, name):
+        return self._documents[name]
+
+    def get(self, name, default=None):
+        return self._documents.get(name, default)
+
+    def __contains__(self, name):
+        return name in self._documents
+
+    def __iter__(self):
+        return iter(self._documents)
+
+    def __len__(self):
+        return len(self._documents)
+
+    def refresh(self):
+        """Reload, now, the documents whose files changed. Return the names of the reloaded ones."""
+        reloaded = []
+        with self._lock:
+            for name, handle in list(self._handles.items()):
+                changed = handle.changed_files()
+                if not changed:
+                    continue
+                state = self._file_state(changed)
+                if self._failed.get(name) == state:
+                    # Already failed with these files: wait for them to change again
+                    continue
+                try:
+                    document = handle.reload()
+                except Exception as e:
+                    self._failed[name] = state
+                    self.errors[name] = e
+                    if self.on_error is not None:
+                        self.on_error(name, e)
+                    continue
+                self._failed.pop(name, None)
+                self.errors.pop(name, None)
+                if document is not self._documents.get(name):
+                    self._publish(name, document)
+                    reloaded.append(name)
+                    if self.on_reload is not None:
+                        self.on_reload(name, document)
+            self._update_watches()
+        return reloaded
+
+    def start(self):
+        """Start watching the files on a background (daemon) thread."""
+        if self._thread is not None:
+            return
+        if INotify is not None and self._inotify is None:
+            self._inotify = INotify()
+            with self._lock:
+                self._update_watches()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="asyncapi-spec-registry", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+            self._watches = {}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wait()
+            if self._stop.is_set() or not self._has_changes():
+                continue
+            # Debounce: wait for the files to stay unchanged for a while
+            state = self._file_state(self._watched_files())
+            while not self._stop.wait(self.debounce):
+                current = self._file_state(self._watched_files())
+                if current == state:
+                    break
+                state = current
+            if not self._stop.is_set():
+                self.refresh()
+
+    def _wait(self):
+        if self._inotify is None:
+            self._stop.wait(self.poll_interval)
+            return
+        # Events only wake the thread up early: changes are detected from the file signatures
+        self._inotify.read(timeout=int(self.poll_interval * 1000))
+
+    def _has_changes(self):
+        for name, handle in list(self._handles.items()):
+            changed = handle.changed_files()
+            if changed and self._failed.get(name) != self._file_state(changed):
+                return True
+        return False
+
+    def _watched_files(self):
+        files = set()
+        for handle in list(self._handles.values()):
+            files.update(handle.signatures)
+        return files
+
+    @staticmethod
+    def _file_state(paths):
+        state = {}
+        for path in paths:
+            try:
+                state[path] = file_signature(path)
+            except OSError:
+                state[path] = None
+        return state
+
+    def _publish(self, name, document):
+        # Readers get either the previous mapping or the new one, never a partially updated one
+        documents = dict(self._documents)
+        documents[name] = document
+        self._documents = documents
+
+    def _update_watches(self):
+        if self._inotify is None:
+            return
+        # Directories are watched rather than files, as editors often replace files by renaming
+        directories = {os.path.dirname(path) for path in self._watched_files()}
+        mask = inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO | inotify_flags.CREATE | inotify_flags.DELETE
+        for directory in directories - self._watches.keys():
+            try:
+                self._watches[directory] = self._inotify.add_watch(directory, mask)
+            except OSError:
+                pass
+        for directory in self._watches.keys() - directories:
+            try:
+                self._inotify.rm_watch(self._watches.pop(directory))
+            except OSError:
+                pass
@@ -0,0 +1,163 @@
+import os
+import threading
+
+from pydantic import ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+
+from .components import Components
+from .dereference import escape_pointer_token
+from .file_cache import FileCache, file_signature, normalize_path
+from .lazy import validate_mapping_item
+from .ref_resolver import RefResolver
+
+
+class SourceUnit:
+    """A validated subtree of a document, with the raw data and the files it was built from."""
+
+    __slots__ = ("raw", "dependencies", "value")
+
+    def __init__(self, raw, dependencies, value):
+        self.raw = raw
+        self.dependencies = dependencies
+        self.value = value
+
+
+class ReloadableDocument:
+    """
+    A document loaded from a file, which can be reloaded incrementally after its sources changed.
+
+    The document is tracked as separate units: each channel item (``#/channels/<uri>``), each
+    component (``#/components/<section>/<name>``) and the rest of the root object (``#``). Every
+    unit records the files it references, transitively. On ``reload`` only the modified files
+    are parsed again, and only the units whose raw data or referenced files changed are resolved
+    and validated again: the others keep their model objects, so ``is`` comparisons can tell
+    what changed.
+
+    A reload that fails, e.g. with a ``ValidationError``, leaves the previous document in place.
+    """
+
+    def __init__(self, model_class, filename, file_cache=None, limits=None):
+        self.model_class = model_class
+        self.filename = normalize_path(filename)
+        self.file_cache = file_cache if file_cache is not None else FileCache()
+        self.limits = limits
+        self.document = None
+        self.units = {}
+        self.signatures = {}
+        self.revalidated = []
+        self._lock = threading.Lock()
+        self.reload()
+
+    def changed_files(self):
+        """Return the paths of the source files modified since the last (re)load."""
+        changed = set()
+        for path, signature in self.signatures.items():
+            try:
+                if file_signature(path) != signature:
+                    changed.add(path)
+            except OSError:
+                changed.add(path)
+        return changed
+
+    def reload(self):
+        """Bring the document up to date with its source files, and return it."""
+        with self._lock:
+            changed = self.changed_files()
+            if self.document is not None and not changed:
+                self.revalidated = []
+                return self.document
+
+            signatures = {self.filename: file_signature(self.filename)}
+            root = self.file_cache.load(self.filename, self.model_class.load_data_from_file)
+            resolver = RefResolver(
+                os.path.dirname(self.filename), self.model_class.load_data_from_file, self.file_cache, limits=self.limits
+            )
+            if not isinstance(root, dict) or not self._has_unit_layout(root):
+                # Let a full validation report what's wrong with the document. Documents it
+                # coerces, e.g. with channels given as a list of pairs, can't be split into units
+                self.model_class.parse_obj(resolver.resolve_document(root))
+                error = TypeError("channels, components and their sections must be mappings")
+                raise ValidationError([ErrorWrapper(error, loc="__root__")], self.model_class)
+
+            units = {}
+            revalidated = []
+            errors = []
+
+            def unit(pointer, raw, validate, loc=()):
+                old = self.units.get(pointer)
+                if old is not None and (old.raw is raw or old.raw == raw) and not old.dependencies & changed:
+                    units[pointer] = old
+                    signatures.update((path, self.signatures[path]) for path in old.dependencies)
+                    return old.value
+                dependencies = resolver.dependencies(raw)
+                for path in dependencies:
+                    signatures.setdefault(path, file_signature(path))
+                try:
+                    value = validate(resolver.resolve(raw))
+                except ValidationError as e:
+                    errors.append(ErrorWrapper(e, loc=loc) if loc else e.raw_errors)
+                    return None
+                units[pointer] = SourceUnit(raw, dependencies, value)
+                revalidated.append(pointer)
+                return value
+
+            channels = {}
+            for uri, raw in root["channels"].items():
+                channels[uri] = unit(
+                    "#/channels/" + escape_pointer_token(uri),
+                    raw,
+                    lambda data, uri=uri: validate_mapping_item(self.model_class, "channels", uri, data),
+                )
+
+            components = None
+            raw_components = root.get("components")
+            if raw_components is not None:
+                sections = {}
+                for name, field in Components.__fields__.items():
+                    raw_section = raw_components.get(field.alias)
+                    if raw_section is None:
+                        continue
+                    section = sections[name] = {}
+                    for key, raw in raw_section.items():
+                        section[key] = unit(
+                            f"#/components/{escape_pointer_token(field.alias)}/{escape_pointer_token(key)}",
+                            raw,
+                            lambda data, name=name, key=key: validate_mapping_item(Components, name, key, data),
+                            loc=("components",),
+                        )
+                components = Components.construct(**sections)
+
+            rest = {key: value for key, value in root.items() if key not in ("channels", "components")}
+            deferred = {"channels": {}, "components": None}
+            document = unit("#", rest, lambda data: self.model_class.parse_obj({**data, **deferred}))
+
+            if errors:
+                # Errors may be single wrappers or lists of them, which pydantic flattens alike
+                raise ValidationError(errors, self.model_class)
+
+            if "#" not in revalidated:
+                # Unchanged root fields: share them with the previous document
+                document = document.copy()
+            document.__dict__["channels"] = channels
+            document.__dict__["components"] = components
+            if components is not None:
+                document.__fields_set__.add("components")
+
+            self.document = document
+            self.units = units
+            self.signatures = signatures
+            self.revalidated = revalidated
+            return document
+
+    @staticmethod
+    def _has_unit_layout(root):
+        components = root.get("components")
+        if not isinstance(root.get("channels"), dict):
+            return False
+        if components is None:
+            return True
+        if not isinstance(components, dict):
+            return False
+        return all(
+            isinstance(components.get(field.alias), (dict, type(None))) for field in Components.__fields__.values()
+        )
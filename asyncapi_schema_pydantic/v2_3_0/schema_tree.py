@@ -0,0 +1,180 @@
+from pydantic import ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+
+from .base_model import interned_instances, subtree_memo
+
+NEW, EXPANDED, BUILT = range(3)
+
+
+class SchemaNode:
+    """A schema object of the tree being built, with the nested schema objects taken out of its data."""
+
+    __slots__ = ("model_class", "data", "memo_key", "state", "nested", "children", "instance", "errors")
+
+    def __init__(self, model_class, data, memo_key=None):
+        self.model_class = model_class
+        self.data = data
+        self.memo_key = memo_key
+        self.state = NEW
+        # Nested schema fields: name -> (alias, empty container of the value, or None for a single schema)
+        self.nested = {}
+        # (field name, key in the container or None, SchemaNode or instance), in data order
+        self.children = []
+        self.instance = None
+        self.errors = None
+
+
+def nested_schemas(kind, value):
+    """
+    Return the ``(key, data)`` of the schema objects nested in the ``value`` of a field of this
+    ``kind``, or None to leave the value to pydantic: values that are not all schema mappings, or
+    that pydantic would not validate as nested schemas (e.g. empty ``items``).
+    """
+    if kind == "schema":
+        return [(None, value)] if isinstance(value, dict) else None
+    if kind == "items":
+        if not value:
+            return None
+        if isinstance(value, dict):
+            return [(None, value)]
+        kind = "list"
+    if kind == "list":
+        if isinstance(value, list) and all(isinstance(item, dict) for item in value):
+            return list(enumerate(value))
+        return None
+    if isinstance(value, dict) and all(isinstance(key, str) and isinstance(item, dict) for key, item in value.items()):
+        return list(value.items())
+    return None
+
+
+def build_schema_tree(model_class, data, node_class):
+    """
+    Validate ``data`` as a ``model_class`` schema object and, with an explicit stack rather than
+    recursion, the schema objects nested in it as ``node_class`` ones, so that the depth of the
+    tree is not limited by the recursion limit.
+
+    Every schema object is validated by pydantic on its own, without its nested schema objects,
+    which are set on it once built. The errors are those of validating the whole tree at once,
+    other than the ones of the ``Union`` members that were not chosen (e.g. "value is not a valid
+    list" for an ``items`` schema).
+    """
+    interned = interned_instances()
+    memo = subtree_memo()
+    # Nodes by id of their data (interning) or memo key: shared nodes are built once
+    seen = {} if interned is not None or memo is not None else None
+    root = SchemaNode(model_class, data)
+    # Depth-first, building every node once all of its children are built
+    stack = [root]
+    path = set()
+    while stack:
+        node = stack[-1]
+        if node.state == BUILT:
+            stack.pop()
+            continue
+        if node.state == EXPANDED:
+            stack.pop()
+            path.discard(id(node.data))
+            build_node(node, interned, memo)
+            node.state = BUILT
+            continue
+        node.state = EXPANDED
+        path.add(id(node.data))
+        fields = node.model_class.__fields__
+        for name, kind in node.model_class.__nested_schema_fields__.items():
+            alias = fields[name].alias
+            value = node.data.get(alias)
+            if value is None:
+                continue
+            items = nested_schemas(kind, value)
+            if items is None:
+                continue
+            node.nested[name] = (alias, None if items and items[0][0] is None else type(value))
+            for key, item in items:
+                if id(item) in path:
+                    raise ValueError("Recursive schema: a schema object contains itself")
+                memo_key = memo.key(node_class, item) if memo is not None else None
+                child = shared_child(node_class, item, memo_key, interned, memo, seen)
+                if child is None:
+                    child = SchemaNode(node_class, item, memo_key)
+                    if seen is not None:
+                        seen[id(item)] = child
+                        if memo_key is not None:
+                            seen[memo_key] = child
+                if isinstance(child, SchemaNode) and child.state == NEW:
+                    # A shared node may already be on the stack below this one: build it first
+                    stack.append(child)
+                node.children.append((name, key, child))
+
+    if root.errors:
+        raise ValidationError(root.errors, model_class)
+    return root.instance
+
+
+def shared_child(node_class, data, memo_key, interned, memo, seen):
+    """The instance or node already built for ``data`` (see ``interning()`` and ``SubtreeMemo``), or None."""
+    if seen is None:
+        return None
+    if interned is not None:
+        entry = interned.get((node_class, id(data)))
+        if entry is not None:
+            return entry[1]
+    child = seen.get(id(data))
+    if child is None and memo_key is not None:
+        child = seen.get(memo_key)
+        if child is None:
+            return memo.get(memo_key)
+        # Same content as another node of this tree: built once for both
+        memo.hits += 1
+    return child
+
+
+def build_node(node, interned, memo):
+    aliases = {alias for alias, _ in node.nested.values()}
+    data = {key: value for key, value in node.data.items() if key not in aliases} if aliases else node.data
+    errors = []
+    try:
+        instance = node.model_class(**data)
+    except ValidationError as e:
+        instance = None
+        errors.extend(relocated(e.raw_errors, ()))
+
+    values = {name: container() if container is not None else None for name, (_, container) in node.nested.items()}
+    for name, key, child in node.children:
+        if isinstance(child, SchemaNode):
+            if child.errors:
+                loc = (node.nested[name][0],) if key is None else (node.nested[name][0], key)
+                errors.extend(ErrorWrapper(error.exc, loc + error.loc_tuple()) for error in child.errors)
+                continue
+            child = child.instance
+        if key is None:
+            values[name] = child
+        elif isinstance(values[name], list):
+            values[name].append(child)
+        else:
+            values[name][key] = child
+
+    if errors:
+        # In field order, like the errors of validating the whole tree at once
+        order = {field.alias: i for i, field in enumerate(node.model_class.__fields__.values())}
+        node.errors = sorted(errors, key=lambda error: order.get(error.loc_tuple()[0], len(order)))
+        return
+
+    # Set like validation would, keeping the field order of __dict__
+    instance.__dict__.update(values)
+    instance.__fields_set__.update(values)
+    if interned is not None:
+        interned[(node.model_class, id(node.data))] = (node.data, instance)
+    if node.memo_key is not None:
+        memo.put(node.memo_key, instance)
+    node.instance = instance
+
+
+def relocated(errors, loc):
+    """Flatten pydantic ``errors``, prefixing their location with ``loc``."""
+    for error in errors:
+        if isinstance(error, list):
+            yield from relocated(error, loc)
+        elif isinstance(error.exc, ValidationError):
+            yield from relocated(error.exc.raw_errors, loc + error.loc_tuple())
+        else:
+            yield ErrorWrapper(error.exc, loc + error.loc_tuple())
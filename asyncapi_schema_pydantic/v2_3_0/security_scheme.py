@@ -2,8 +2,9 @@ from typing import Optional
 
 from enum import Enum
 
-from pydantic import BaseModel, Field, Extra
+from pydantic import Field, Extra
 
+from .base_model import AsyncAPIModel
 from .oauth_flows import OAuthFlows
 
 
@@ -33,7 +34,7 @@ class SecuritySchemeLocation(str, Enum):
     httpApiKey = 'httpApiKey'
 
 
-class SecurityScheme(BaseModel):
+class SecurityScheme(AsyncAPIModel):
     """
     Defines a security scheme that can be used by the operations. Supported schemes are:
         User/Password.
@@ -0,0 +1,71 @@
+from .ref_resolver import pointer_tokens
+
+
+def select_channels(data, predicate):
+    """
+    Return a copy of the document ``data`` keeping only the channels for which
+    ``predicate(channel_uri, channel_data)`` is true, given the raw data of the channel item, and
+    the components they reference, transitively. Everything else in the components section is
+    dropped, so it is never validated. The rest of the document (``info``, ``servers``, ...) is
+    kept, together with the components it references, e.g. the security schemes of the servers.
+
+    Internal references to other channels (``#/channels/...``) also select these channels.
+    ``data`` is not modified: external references must already be inlined, as the internal
+    references inside the files they point to are looked up in ``data``.
+    """
+    channels = data.get("channels")
+    if not isinstance(channels, dict):
+        return data
+    components = data.get("components")
+    if not isinstance(components, dict):
+        components = {}
+
+    selected = {uri for uri, item in channels.items() if predicate(uri, item)}
+    kept = {}
+    stack = [value for key, value in data.items() if key not in ("channels", "components")]
+    stack.extend(channels[uri] for uri in selected)
+
+    def keep(section, name):
+        entries = components.get(section)
+        if isinstance(entries, dict) and name in entries and name not in kept.setdefault(section, set()):
+            kept[section].add(name)
+            stack.append(entries[name])
+
+    servers = data.get("servers")
+    for server in servers.values() if isinstance(servers, dict) else ():
+        # Security requirements name their security schemes rather than referencing them
+        security = server.get("security") if isinstance(server, dict) else None
+        requirements = security.values() if isinstance(security, dict) else security
+        for requirement in requirements if isinstance(security, (dict, list)) else ():
+            for name in requirement if isinstance(requirement, dict) else ():
+                keep("securitySchemes", name)
+
+    visited = set()
+    while stack:
+        node = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith("#/"):
+                tokens = pointer_tokens(ref[1:])
+                if len(tokens) >= 3 and tokens[0] == "components":
+                    keep(tokens[1], tokens[2])
+                elif len(tokens) >= 2 and tokens[0] == "channels" and tokens[1] in channels:
+                    if tokens[1] not in selected:
+                        selected.add(tokens[1])
+                        stack.append(channels[tokens[1]])
+            stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(value for value in node if isinstance(value, (dict, list)))
+
+    selection = dict(data)
+    selection["channels"] = {uri: item for uri, item in channels.items() if uri in selected}
+    if "components" in data and isinstance(data["components"], dict):
+        selection["components"] = {
+            section: {name: entry for name, entry in entries.items() if name in kept.get(section, ())}
+            if isinstance(entries, dict) else entries
+            for section, entries in components.items()
+        }
+    return selection
@@ -1,8 +1,9 @@
 from typing import Dict, List, Optional, Union
 
-from pydantic import BaseModel, Extra, constr
+from pydantic import Extra, constr
 
-from .reference import Reference
+from .base_model import AsyncAPIModel
+from .reference import Reference, reference_dispatcher
 from .server_bindings import ServerBindings
 from .security_requirement import SecurityRequirement
 from .server_variable import ServerVariable
@@ -10,7 +11,7 @@ from .server_variable import ServerVariable
 ServerIdentifier = constr(regex=r'^[A-Za-z0-9_\-]+$')
 
 
-class Server(BaseModel):
+class Server(AsyncAPIModel):
     """An object representing a Server."""
 
     url: str = ...
@@ -56,9 +57,12 @@ class Server(BaseModel):
     definitions for the server.
     """
 
+    _dispatch_references = reference_dispatcher("bindings")
+
 
     class Config:
         extra = Extra.forbid
+        smart_union = True
         schema_extra = {
             "examples": [
                             {
@@ -1,7 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .bindings import BindingsModel
 from .http_bindings import HttpServerBinding
 from .web_sockets_bindings import WebSocketsServerBinding
 from .kafka_bindings import KafkaServerBinding
@@ -20,11 +21,13 @@ from .redis_bindings import RedisServerBinding
 from .mercure_bindings import MercureServerBinding
 from .ibm_mq_bindings import IbmMqServerBinding
 
-class ServerBindings(BaseModel):
+class ServerBindings(BindingsModel):
     """
     Map describing protocol-specific definitions for a server.
     """
 
+    __memoize_subtrees__ = True
+
     http: Optional[HttpServerBinding] = None
     """
     Protocol-specific information for an HTTP server.
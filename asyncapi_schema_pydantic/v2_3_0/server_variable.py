@@ -1,9 +1,11 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class ServerVariable(BaseModel):
+
+class ServerVariable(AsyncAPIModel):
     """An object representing a Server Variable for server URL template substitution."""
 
     enum: Optional[List[str]] = None
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+import pydantic
+
+from .file_cache import normalize_path
+
+SNAPSHOT_FORMAT = 1
+"""
+Version of the snapshot layout. It is part of every cache key, so bumping it (e.g. when the
+models change in an incompatible way) invalidates all the existing snapshots.
+"""
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def text_digest(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class SnapshotCache:
+    """
+    On-disk cache of validated AsyncAPI documents.
+
+    A snapshot is keyed on the content hash of the root file and of every file it references,
+    transitively. A manifest per root file records which files were part of the last load, so a
+    lookup only needs to hash those files: on a hit the document is unpickled, skipping parsing,
+    reference resolution and validation altogether.
+
+    Snapshots are pickles, so the cache directory must only be writable by trusted users.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def load(self, filename, build, options=None):
+        """
+        Return the cached document of ``filename``, or call ``build()`` and cache its result.
+
+        ``build`` returns the validated document and the paths of all the files it was loaded from.
+        ``options`` are the JSON serializable options ``build`` loads the document with, e.g.
+        ``{"lazy_references": True}``: documents loaded with other options are cached apart.
+        """
+        options = options or {}
+        key = json.dumps([normalize_path(filename), options], sort_keys=True)
+        manifest_path = os.path.join(self.cache_dir, text_digest(key) + ".manifest")
+        manifest = self._read_manifest(manifest_path)
+        if manifest is not None:
+            try:
+                snapshot_path = self._snapshot_path(manifest["sources"], options)
+            except OSError:
+                snapshot_path = None
+            if snapshot_path is not None:
+                document = self._read_snapshot(snapshot_path)
+                if document is not None:
+                    return document
+
+        document, sources = build()
+        root = normalize_path(filename)
+        sources = [root] + [path for path in map(normalize_path, sources) if path != root]
+        snapshot_path = self._snapshot_path(sources, options)
+        self._write(snapshot_path, pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL))
+        self._write(manifest_path, json.dumps({"sources": sources, "snapshot": snapshot_path}).encode("utf-8"))
+        if manifest is not None and manifest["snapshot"] != snapshot_path:
+            # The previous snapshot of this root file can never be a hit again
+            try:
+                os.unlink(manifest["snapshot"])
+            except OSError:
+                pass
+        return document
+
+    def _snapshot_path(self, sources, options):
+        key = json.dumps(
+            [SNAPSHOT_FORMAT, pydantic.VERSION, [(path, file_digest(path)) for path in sources], options], sort_keys=True
+        )
+        return os.path.join(self.cache_dir, text_digest(key) + ".snapshot")
+
+    @staticmethod
+    def _read_manifest(path):
+        try:
+            with open(path, "rb") as f:
+                manifest = json.loads(f.read())
+            return manifest if isinstance(manifest, dict) and manifest.keys() == {"sources", "snapshot"} else None
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _read_snapshot(path):
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # A corrupted or outdated snapshot is rebuilt and overwritten
+            return None
+
+    def _write(self, path, content):
+        # Write to a temporary file first, so concurrent readers never see a partial snapshot
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
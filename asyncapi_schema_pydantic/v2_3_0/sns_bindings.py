@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class SnsChannelBinding(BaseModel):
+
+class SnsChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe SNS-specific information on AsyncAPI.
 
@@ -13,7 +15,7 @@ class SnsChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class SnsMessageBinding(BaseModel):
+class SnsMessageBinding(AsyncAPIModel):
     """
     This document defines how to describe SNS-specific information on AsyncAPI.
 
@@ -25,7 +27,7 @@ class SnsMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class SnsOperationBinding(BaseModel):
+class SnsOperationBinding(AsyncAPIModel):
     """
     This document defines how to describe SNS-specific information on AsyncAPI.
 
@@ -37,7 +39,7 @@ class SnsOperationBinding(BaseModel):
         extra = Extra.forbid
 
 
-class SnsServerBinding(BaseModel):
+class SnsServerBinding(AsyncAPIModel):
     """
     This document defines how to describe SNS-specific information on AsyncAPI.
 
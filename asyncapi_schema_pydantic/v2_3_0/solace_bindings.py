@@ -2,10 +2,12 @@ from typing import Optional, List
 
 from enum import Enum
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class SolaceMessageType(BaseModel):
+
+class SolaceMessageType(AsyncAPIModel):
     """
     This object MUST NOT contain any properties. Its name is reserved for future use.
     """
@@ -25,7 +27,7 @@ class SolaceQueueAccessType(str, Enum):
     nonExclusive = 'nonExclusive'
 
 
-class SolaceQueue(BaseModel):
+class SolaceQueue(AsyncAPIModel):
     """
     Solace queue definition.
     """
@@ -52,7 +54,7 @@ class SolaceQueue(BaseModel):
         extra = Extra.forbid
 
 
-class SolaceDestination(BaseModel):
+class SolaceDestination(AsyncAPIModel):
     """
     Each destination has the following structure. Note that bindings under a
     'subscribe' operation define the behaviour of publishers, and those under
@@ -78,7 +80,7 @@ class SolaceDestination(BaseModel):
     """
 
 
-class SolaceMessageBinding(BaseModel):
+class SolaceMessageBinding(AsyncAPIModel):
     """
     This document defines how to describe Solace-specific information with AsyncAPI.
 
@@ -90,7 +92,7 @@ class SolaceMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class SolaceChannelBinding(BaseModel):
+class SolaceChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe Solace-specific information with AsyncAPI.
 
@@ -102,7 +104,7 @@ class SolaceChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class SolaceOperationBinding(BaseModel):
+class SolaceOperationBinding(AsyncAPIModel):
     """
     We need the ability to support several bindings for each operation, see the
     Example section below for details.
@@ -123,7 +125,7 @@ class SolaceOperationBinding(BaseModel):
         extra = Extra.forbid
 
 
-class SolaceServerBinding(BaseModel):
+class SolaceServerBinding(AsyncAPIModel):
     """
     This document defines how to describe Solace-specific information with AsyncAPI.
     """
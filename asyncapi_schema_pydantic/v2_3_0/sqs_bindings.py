@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class SqsChannelBinding(BaseModel):
+
+class SqsChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe SQS-specific information on AsyncAPI.
 
@@ -13,7 +15,7 @@ class SqsChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class SqsMessageBinding(BaseModel):
+class SqsMessageBinding(AsyncAPIModel):
     """
     This document defines how to describe SQS-specific information on AsyncAPI.
 
@@ -25,7 +27,7 @@ class SqsMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class SqsOperationBinding(BaseModel):
+class SqsOperationBinding(AsyncAPIModel):
     """
     This document defines how to describe SQS-specific information on AsyncAPI.
 
@@ -37,7 +39,7 @@ class SqsOperationBinding(BaseModel):
         extra = Extra.forbid
 
 
-class SqsServerBinding(BaseModel):
+class SqsServerBinding(AsyncAPIModel):
     """
     This document defines how to describe SQS-specific information on AsyncAPI.
 
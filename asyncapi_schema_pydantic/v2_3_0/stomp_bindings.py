@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 
-class StompChannelBinding(BaseModel):
+
+class StompChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe STOMP-specific information on AsyncAPI.
 
@@ -13,7 +15,7 @@ class StompChannelBinding(BaseModel):
         extra = Extra.forbid
 
 
-class StompMessageBinding(BaseModel):
+class StompMessageBinding(AsyncAPIModel):
     """
     This document defines how to describe STOMP-specific information on AsyncAPI.
 
@@ -25,7 +27,7 @@ class StompMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class StompOperationBinding(BaseModel):
+class StompOperationBinding(AsyncAPIModel):
     """
     This document defines how to describe STOMP-specific information on AsyncAPI.
 
@@ -37,7 +39,7 @@ class StompOperationBinding(BaseModel):
         extra = Extra.forbid
 
 
-class StompServerBinding(BaseModel):
+class StompServerBinding(AsyncAPIModel):
     """
     This document defines how to describe STOMP-specific information on AsyncAPI.
 
@@ -0,0 +1,138 @@
+import yaml
+from yaml.composer import ComposerError
+from yaml.nodes import MappingNode, ScalarNode, SequenceNode
+
+from .lazy import ComponentResolver, validate_mapping_item
+
+
+class YamlEventReader:
+    """
+    Reads a YAML (or JSON) document from its event stream, one value at a time.
+
+    Values are composed into nodes and constructed into Python objects only on request, so
+    the values that are skipped are never held in memory.
+    """
+
+    def __init__(self, stream, loader_class):
+        self.loader = loader_class(stream)
+        self.anchors = {}
+        self.loader.get_event()  # StreamStartEvent
+        self.loader.get_event()  # DocumentStartEvent
+
+    def close(self):
+        self.loader.dispose()
+
+    def mapping_keys(self):
+        """
+        Iterate over the keys of the mapping starting at the current event. The value of each
+        key must be consumed with ``read_value`` or ``skip_value`` before asking for the next key.
+        """
+        if not self.loader.check_event(yaml.MappingStartEvent):
+            self.skip_value()
+            return
+        self.loader.get_event()
+        while not self.loader.check_event(yaml.MappingEndEvent):
+            yield self.read_value()
+        self.loader.get_event()
+
+    def read_value(self):
+        return self.loader.construct_document(self.compose())
+
+    def skip_value(self):
+        depth = 0
+        while True:
+            event = self.loader.peek_event()
+            if getattr(event, "anchor", None) is not None and not isinstance(event, yaml.AliasEvent):
+                # Anchored nodes are composed, for the aliases to them in the values read later
+                self.compose()
+                if depth == 0:
+                    return
+                continue
+            event = self.loader.get_event()
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                depth += 1
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+            if depth == 0:
+                return
+
+    def compose(self):
+        event = self.loader.get_event()
+        if isinstance(event, yaml.AliasEvent):
+            if event.anchor not in self.anchors:
+                raise ComposerError(None, None, f"found undefined alias {event.anchor}", event.start_mark)
+            return self.anchors[event.anchor]
+
+        if isinstance(event, yaml.ScalarEvent):
+            tag = event.tag
+            if tag is None or tag == "!":
+                tag = self.loader.resolve(ScalarNode, event.value, event.implicit)
+            node = ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+            if event.anchor is not None:
+                self.anchors[event.anchor] = node
+            return node
+
+        if isinstance(event, yaml.SequenceStartEvent):
+            node_class, end_event = SequenceNode, yaml.SequenceEndEvent
+        else:
+            node_class, end_event = MappingNode, yaml.MappingEndEvent
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = self.loader.resolve(node_class, None, event.implicit)
+        node = node_class(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        if event.anchor is not None:
+            self.anchors[event.anchor] = node
+        while not self.loader.check_event(end_event):
+            if node_class is SequenceNode:
+                node.value.append(self.compose())
+            else:
+                key = self.compose()
+                node.value.append((key, self.compose()))
+        node.end_mark = self.loader.get_event().end_mark
+        return node
+
+
+def read_components(open_stream, loader_class):
+    """Return the raw ``components`` of a document, skipping everything else."""
+    stream = open_stream()
+    reader = YamlEventReader(stream, loader_class)
+    try:
+        for key in reader.mapping_keys():
+            if key == "components":
+                return reader.read_value()
+            reader.skip_value()
+    finally:
+        reader.close()
+        stream.close()
+    return None
+
+
+def iter_channels(model_class, open_stream, loader_class, ref_resolver):
+    """
+    Yield the ``(channel_uri, ChannelItem)`` pairs of a document as they are parsed.
+
+    ``open_stream`` returns a new binary stream of the document each time it's called: the
+    components are read in a first pass, then the channels are read, resolved and validated one
+    at a time. Components are kept raw and validated when a reference to them is first used.
+    """
+    components = read_components(open_stream, loader_class)
+    component_resolver = None
+    if isinstance(components, dict):
+        component_resolver = ComponentResolver(ref_resolver.resolve(components))
+
+    stream = open_stream()
+    reader = YamlEventReader(stream, loader_class)
+    try:
+        for key in reader.mapping_keys():
+            if key != "channels":
+                reader.skip_value()
+                continue
+            for channel_uri in reader.mapping_keys():
+                data = ref_resolver.resolve(reader.read_value())
+                channel = validate_mapping_item(model_class, "channels", channel_uri, data)
+                if component_resolver is not None:
+                    channel = component_resolver.attach(channel)
+                yield channel_uri, channel
+    finally:
+        reader.close()
+        stream.close()
@@ -1,11 +1,12 @@
 from typing import Optional
 
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 from .external_documentation import ExternalDocumentation
 
 
-class Tag(BaseModel):
+class Tag(AsyncAPIModel):
     """Allows adding meta data to a single tag."""
 
     name: str = ...
@@ -1,7 +1,8 @@
 from typing import Optional
 from enum import Enum
-from pydantic import BaseModel, Extra
+from pydantic import Extra
 
+from .base_model import AsyncAPIModel
 from .schema import Schema
 
 
@@ -10,7 +11,7 @@ class WebSocketsMethod(str, Enum):
     post = 'POST'
 
 
-class WebSocketsChannelBinding(BaseModel):
+class WebSocketsChannelBinding(AsyncAPIModel):
     """
     When using WebSockets, the channel represents the connection. Unlike other
     protocols that support multiple virtual channels (topics, routing keys, etc.)
@@ -44,7 +45,7 @@ class WebSocketsChannelBinding(BaseModel):
     """
 
 
-class WebSocketsMessageBinding(BaseModel):
+class WebSocketsMessageBinding(AsyncAPIModel):
     """
     This document defines how to describe WebSockets-specific information on AsyncAPI.
 
@@ -55,7 +56,7 @@ class WebSocketsMessageBinding(BaseModel):
         extra = Extra.forbid
 
 
-class WebSocketsOperationBinding(BaseModel):
+class WebSocketsOperationBinding(AsyncAPIModel):
     """
     This document defines how to describe WebSockets-specific information on AsyncAPI.
 
@@ -66,7 +67,7 @@ class WebSocketsOperationBinding(BaseModel):
         extra = Extra.forbid
 
 
-class WebSocketsServerBinding(BaseModel):
+class WebSocketsServerBinding(AsyncAPIModel):
     """
     This document defines how to describe WebSockets-specific information on AsyncAPI.
 
@@ -77,7 +78,7 @@ class WebSocketsServerBinding(BaseModel):
         extra = Extra.forbid
 
 
-class WebSocketsChannelBinding(BaseModel):
+class WebSocketsChannelBinding(AsyncAPIModel):
     """
     This document defines how to describe WebSockets-specific information on AsyncAPI.
 
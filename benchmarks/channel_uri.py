@@ -0,0 +1,93 @@
+"""
+Compares the channel URI scanner (``parse_channel_uri``) with the regular expression it replaced
+(``CHANNEL_URI_PATTERN``): a fuzz run checking that both accept the same URIs, then timings on
+typical and adversarial URIs.
+
+Run from the repository root, with the package installed (``pip install -e .``):
+
+    python benchmarks/channel_uri.py [number of fuzzed URIs]
+"""
+import random
+import re
+import sys
+import time
+
+from asyncapi_schema_pydantic.v2_3_0.channel_uri import CHANNEL_URI_PATTERN, ChannelUriError, parse_channel_uri
+
+REGEX = re.compile(CHANNEL_URI_PATTERN)
+
+ALPHABET = list("ab_Z9{}%,.:*/?+#;&=!@|-~ \"'<>\\^`\x00\x7f\n") + [
+    "%2F", "%zz", "é", "٣", "{a}", "{a.b}", ":12345", ":0", "{+x*}", "{a,b:5}", "ـ", "²",
+]
+
+
+def scanner_accepts(uri):
+    try:
+        # Bypass the cache, which would make the timings meaningless
+        parse_channel_uri.__wrapped__(uri)
+    except ChannelUriError:
+        return False
+    return True
+
+
+def regex_accepts(uri):
+    return REGEX.match(uri) is not None
+
+
+def fuzz(count, seed=1):
+    """Return the random URIs accepted by only one of the regex and the scanner."""
+    rng = random.Random(seed)
+    mismatches = []
+    for _ in range(count):
+        uri = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 14)))
+        if regex_accepts(uri) != scanner_accepts(uri):
+            mismatches.append(uri)
+    # Every character on its own and in expressions
+    for character in map(chr, range(0x3000)):
+        for uri in (character, "{" + character + "}", "{a" + character + "b}", "{a:1" + character + "}"):
+            if regex_accepts(uri) != scanner_accepts(uri):
+                mismatches.append(uri)
+    return mismatches
+
+
+def best_time(function, uri, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(uri)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+CASES = {
+    "typical": lambda n: "smartylighting/streetlights/1/0/event/{streetlightId}/lighting/measured",
+    "typical, invalid": lambda n: "smartylighting/streetlights/1/0/event/{streetlightId/lighting",
+    "literal 'a' * 10n": lambda n: "a" * (n * 10),
+    "'%41' * n + '%'": lambda n: "%41" * n + "%",
+    "'{a' + '.a' * n": lambda n: "{a" + ".a" * n,
+    "'{' + 'a,' * n": lambda n: "{" + "a," * n,
+    "'{' + 'a:1,' * n": lambda n: "{" + "a:1," * n,
+    "'a{b}' * n + '{'": lambda n: "a{b}" * n + "{",
+}
+
+
+def main(count):
+    mismatches = fuzz(count)
+    print(f"Fuzzed {count} URIs: {len(mismatches)} accepted by only one of the regex and the scanner")
+    # The regex's $ also matches before a trailing newline, which the scanner rejects
+    mismatches = [uri for uri in mismatches if not (uri.endswith("\n") and regex_accepts(uri[:-1]))]
+    print(f"{len(mismatches)} of them other than a valid URI followed by a newline")
+    for uri in sorted(set(mismatches), key=len)[:10]:
+        print(f"  {uri!r} regex={regex_accepts(uri)} scanner={scanner_accepts(uri)}")
+
+    print(f"\n{'URI':24} {'n':>6} {'regex':>12} {'scanner':>12}")
+    for name, make_uri in CASES.items():
+        for n in (1000, 4000, 16000) if "typical" not in name else (1,):
+            uri = make_uri(n)
+            regex = best_time(regex_accepts, uri, 5)
+            scanner = best_time(scanner_accepts, uri, 5)
+            print(f"{name:24} {n:>6} {regex * 1e6:10.1f}us {scanner * 1e6:10.1f}us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
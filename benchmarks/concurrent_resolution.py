@@ -0,0 +1,55 @@
+"""
+Compares resolving the external references of a document serially and on a thread pool
+(``max_workers``), on generated files read with a simulated latency, as on a network filesystem.
+
+Run from the repository root, with the package installed (``pip install -e .``):
+
+    python benchmarks/concurrent_resolution.py [number of files] [latency in ms]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from asyncapi_schema_pydantic import AsyncAPI, RefResolver
+
+
+def write_spec(folder, file_count):
+    """Write ``file_count`` schema files, each referencing a common one, and return a document referencing them."""
+    with open(os.path.join(folder, "common.yaml"), "w") as f:
+        json.dump({"type": "object", "properties": {"id": {"type": "string"}}}, f)
+    channels = {}
+    for i in range(file_count):
+        with open(os.path.join(folder, f"event{i}.yaml"), "w") as f:
+            json.dump({"type": "object", "properties": {"common": {"$ref": "common.yaml"}, "n": {"const": i}}}, f)
+        channels[f"events/{i}"] = {"subscribe": {"message": {"payload": {"$ref": f"event{i}.yaml"}}}}
+    return {"asyncapi": "2.3.0", "info": {"title": "Events", "version": "1"}, "channels": channels}
+
+
+def slow_loader(latency):
+    def load(path):
+        time.sleep(latency)
+        return AsyncAPI.load_data_from_file(path)
+
+    return load
+
+
+def main(file_count, latency_ms):
+    with tempfile.TemporaryDirectory() as folder:
+        data = write_spec(folder, file_count)
+        loader = slow_loader(latency_ms / 1000)
+        results = {}
+        for max_workers in (None, 4, 16, 64):
+            start = time.perf_counter()
+            resolved = RefResolver(folder, loader, max_workers=max_workers).resolve_document(data)
+            elapsed = time.perf_counter() - start
+            results[max_workers] = resolved
+            print(f"max_workers={max_workers!s:5} {elapsed:8.3f}s")
+        serial = json.dumps(results[None], sort_keys=True)
+        identical = all(json.dumps(resolved, sort_keys=True) == serial for resolved in results.values())
+        print(f"{file_count + 1} files, {latency_ms}ms latency per read; output identical to the serial one: {identical}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200, float(sys.argv[2]) if len(sys.argv) > 2 else 5)
@@ -0,0 +1,81 @@
+"""
+Compares building documents from already validated data with ``construct_trusted`` and with
+``parse_obj``, on the sample document and on a generated one, and checks that the results are equal.
+
+Run from the repository root, with the package installed (``pip install -e .``):
+
+    python benchmarks/construct_trusted.py [number of channels]
+"""
+import json
+import os
+import sys
+import time
+
+from asyncapi_schema_pydantic import AsyncAPI
+
+SAMPLE = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "data", "sample.yaml")
+
+
+def generate_spec(channel_count):
+    """A document with ``channel_count`` channels, using the aliased fields ($ref, is, in, schema)."""
+    channels = {}
+    for i in range(channel_count):
+        channels[f"orders/{{orderId}}/events/{i}"] = {
+            "parameters": {"orderId": {"schema": {"type": "string", "pattern": "^[0-9]+$"}}},
+            "bindings": {"amqp": {"is": "queue", "queue": {"name": f"orders-{i}", "durable": True}}},
+            "subscribe": {
+                "operationId": f"onOrderEvent{i}",
+                "message": {
+                    "name": f"OrderEvent{i}",
+                    "contentType": "application/json",
+                    "headers": {"$ref": "#/components/schemas/Headers"},
+                    "payload": {
+                        "type": "object",
+                        "required": ["id"],
+                        "properties": {
+                            "id": {"type": "string"},
+                            "amount": {"type": "number", "minimum": 0},
+                            "items": {"type": "array", "items": {"type": "object", "properties": {"sku": {"type": "string"}}}},
+                        },
+                    },
+                },
+            },
+        }
+    return {
+        "asyncapi": "2.3.0",
+        "info": {"title": "Orders", "version": "1"},
+        "channels": channels,
+        "components": {
+            "schemas": {"Headers": {"type": "object", "properties": {"traceId": {"type": "string"}}}},
+            "securitySchemes": {"key": {"type": "httpApiKey", "name": "api_key", "in": "header"}},
+        },
+    }
+
+
+def best_time(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(channel_count):
+    specs = {
+        "sample.yaml": AsyncAPI.load_data_from_file(SAMPLE),
+        f"generated, {channel_count} channels": generate_spec(channel_count),
+    }
+    for name, data in specs.items():
+        # Trusted data is data validated and serialized before, e.g. by a cache
+        data = json.loads(AsyncAPI.parse_obj(data).json(by_alias=True, exclude_unset=True))
+        parsed_time, parsed = best_time(lambda: AsyncAPI.parse_obj(data), 5)
+        constructed_time, constructed = best_time(lambda: AsyncAPI.construct_trusted(data), 5)
+        print(
+            f"{name:28} parse_obj {parsed_time * 1e3:9.1f}ms  construct_trusted {constructed_time * 1e3:9.1f}ms"
+            f"  equal: {constructed == parsed}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,61 @@
+"""
+Compares loading a document that references the same external schema from many channels,
+with and without ``intern_references``: load time, and the memory held by the loaded document.
+
+Run from the repository root, with the package installed (``pip install -e .``):
+
+    python benchmarks/interning.py [number of channels] [number of properties]
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from asyncapi_schema_pydantic import AsyncAPI
+
+
+def write_spec(folder, channel_count, property_count):
+    """Write a document whose ``channel_count`` channels all reference one schema file, and return its path."""
+    schema = {"type": "object", "properties": {f"p{i}": {"type": "string", "maxLength": i} for i in range(property_count)}}
+    with open(os.path.join(folder, "shared.json"), "w") as f:
+        json.dump(schema, f)
+    channels = {
+        f"events/{i}": {"subscribe": {"message": {"payload": {"$ref": "shared.json"}}}} for i in range(channel_count)
+    }
+    path = os.path.join(folder, "spec.json")
+    with open(path, "w") as f:
+        json.dump({"asyncapi": "2.3.0", "info": {"title": "Shared", "version": "1"}, "channels": channels}, f)
+    return path
+
+
+def measure(path, intern_references):
+    gc.collect()
+    start = time.perf_counter()
+    async_api = AsyncAPI.load_from_file(path, intern_references=intern_references)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    async_api = AsyncAPI.load_from_file(path, intern_references=intern_references)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return async_api, elapsed, retained
+
+
+def main(channel_count, property_count):
+    with tempfile.TemporaryDirectory() as folder:
+        path = write_spec(folder, channel_count, property_count)
+        outputs = []
+        for intern_references in (False, True):
+            async_api, elapsed, retained = measure(path, intern_references)
+            outputs.append(async_api.json(by_alias=True))
+            print(f"intern_references={intern_references!s:5} {elapsed:8.3f}s {retained / 1e6:8.1f}MB retained")
+        print(f"{channel_count} channels referencing one {property_count}-property schema; "
+              f"same serialized output: {outputs[0] == outputs[1]}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500, int(sys.argv[2]) if len(sys.argv) > 2 else 200)
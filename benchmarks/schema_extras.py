@@ -0,0 +1,105 @@
+"""
+Measures the validation time and retained memory of ``Schema.parse_obj`` on a deep and wide
+payload schema with the ``extras`` handling of ``JsonSchemaObject.__init__`` (an empty dict made
+on first use for the nodes without extras), against the one it had before (a comprehension and
+an assignment for every node).
+
+Run from the repository root, with the package installed (``pip install -e .``):
+
+    python benchmarks/schema_extras.py [depth] [width]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from asyncapi_schema_pydantic.v2_3_0 import Schema
+from asyncapi_schema_pydantic.v2_3_0.base_model import AsyncAPIModel
+from asyncapi_schema_pydantic.v2_3_0.json_schema import EXCLUDE_FIELD_KEYS, JsonSchemaObject
+
+
+def payload_schema(depth, width):
+    """Objects of ``width`` properties and arrays, alternately, nested ``depth`` levels deep."""
+    if depth == 0:
+        return {"type": "string", "maxLength": 10}
+    if depth % 2:
+        return {
+            "type": "object",
+            "required": ["p0"],
+            "properties": {f"p{i}": payload_schema(depth - 1, width) for i in range(width)},
+        }
+    return {"type": "array", "items": payload_schema(depth - 1, width)}
+
+
+def schema_nodes(data):
+    count = 0
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.get("properties", {}).values())
+        if isinstance(node.get("items"), dict):
+            stack.append(node["items"])
+    return count
+
+
+def init_before(self, **data):
+    # JsonSchemaObject.__init__ as it was before
+    AsyncAPIModel.__init__(self, **data)
+    self.extras = {k: v for k, v in data.items() if k not in EXCLUDE_FIELD_KEYS}
+
+
+@contextmanager
+def extras_before():
+    init = JsonSchemaObject.__init__
+    JsonSchemaObject.__init__ = init_before
+    try:
+        yield
+    finally:
+        JsonSchemaObject.__init__ = init
+
+
+@contextmanager
+def extras_now():
+    yield
+
+
+def best_time(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        start = time.process_time()
+        function()
+        best = min(best, time.process_time() - start)
+        gc.enable()
+    return best
+
+
+def retained_memory(function):
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained
+
+
+def main(depth, width, repeat=5):
+    data = payload_schema(depth, width)
+    print(f"{schema_nodes(data)} schema nodes")
+    results = {}
+    for name, context in (("before", extras_before), ("now", extras_now)):
+        with context():
+            elapsed = best_time(lambda: Schema.parse_obj(data), repeat)
+            schema, retained = retained_memory(lambda: Schema.parse_obj(data))
+        results[name] = schema
+        print(f"Schema.parse_obj, {name:6} {elapsed:.3f}s, {retained / 1e6:.1f}MB retained")
+    assert results["before"] == results["now"]
+    return results
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 9, int(sys.argv[2]) if len(sys.argv) > 2 else 6)
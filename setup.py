@@ -21,6 +21,11 @@ setup(
         "Operating System :: OS Independent",
     ],
     packages=find_packages(exclude=["tests"]),
-    install_requires=["pydantic>=1.8.2", "PyYAML~=6.0"],
+    install_requires=["pydantic>=1.9", "PyYAML~=6.0"],
+    extras_require={
+        "inotify": ["inotify_simple>=1.3"],
+        "orjson": ["orjson>=3"],
+        "toml": ["tomli>=1.1; python_version < '3.11'"],
+    },
     python_requires=">=3.7",
 )
@@ -0,0 +1,71 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from asyncapi_schema_pydantic.v2_3_0 import AsyncAPI, FileCache, LazyModelDict, RefBudgetExceededError, ResolutionLimits
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "data", "sample.yaml")
+
+
+def test_aload_from_file_matches_load_from_file():
+    document = asyncio.run(AsyncAPI.aload_from_file(SAMPLE))
+    assert document == AsyncAPI.load_from_file(SAMPLE)
+
+
+def test_concurrent_loads(tmp_path):
+    (tmp_path / "message.yaml").write_text("name: external\n")
+    spec = tmp_path / "spec.yaml"
+    spec.write_text(
+        "asyncapi: 2.3.0\ninfo:\n  title: t\n  version: '1'\n"
+        "channels:\n  a:\n    publish:\n      message:\n        $ref: message.yaml\n"
+    )
+
+    async def load_all():
+        with ThreadPoolExecutor(4) as executor:
+            return await asyncio.gather(
+                *(AsyncAPI.aload_from_file(str(spec), FileCache(), executor) for _ in range(8))
+            )
+
+    documents = asyncio.run(load_all())
+    assert all(document.channels["a"].publish.message.name == "external" for document in documents)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"max_workers": 2},
+        {"dereference_components": True},
+        {"lazy_references": True, "lazy_channels": True},
+        {"intern_references": True},
+        {"channels": lambda uri, item: False},
+        {"protocols": ["kafka"]},
+    ],
+)
+def test_aload_from_file_takes_the_options_of_load_from_file(options):
+    document = asyncio.run(AsyncAPI.aload_from_file(SAMPLE, **options))
+    assert document == AsyncAPI.load_from_file(SAMPLE, **options)
+
+
+def test_aload_from_file_validates_lazily():
+    document = asyncio.run(AsyncAPI.aload_from_file(SAMPLE, lazy_references=True))
+    assert isinstance(document.components.messages, LazyModelDict)
+
+
+def test_aload_from_file_reuses_snapshots(tmp_path):
+    first = asyncio.run(AsyncAPI.aload_from_file(SAMPLE, cache_dir=str(tmp_path)))
+    second = asyncio.run(AsyncAPI.aload_from_file(SAMPLE, cache_dir=str(tmp_path)))
+    assert second == first
+    assert len(list(tmp_path.glob("*.snapshot"))) == 1
+
+
+def test_aload_from_file_limits(tmp_path):
+    (tmp_path / "message.yaml").write_text("name: external\n")
+    spec = tmp_path / "spec.yaml"
+    spec.write_text(
+        "asyncapi: 2.3.0\ninfo:\n  title: t\n  version: '1'\n"
+        "channels:\n  a:\n    publish:\n      message:\n        $ref: message.yaml\n"
+    )
+    with pytest.raises(RefBudgetExceededError):
+        asyncio.run(AsyncAPI.aload_from_file(str(spec), limits=ResolutionLimits(max_bytes=1)))
@@ -0,0 +1,77 @@
+import pytest
+from pydantic import ValidationError
+
+from asyncapi_schema_pydantic.v2_3_0 import (
+    AsyncAPI,
+    ChannelExpression,
+    ChannelTemplate,
+    ChannelUriError,
+    ChannelVariable,
+    parse_channel_uri,
+)
+
+
+def test_literal_uri():
+    assert parse_channel_uri("user/signedup") == ChannelTemplate("user/signedup", ("user/signedup",))
+
+
+def test_template():
+    template = parse_channel_uri("smartylighting/{streetlightId}/lighting/{+path*}/{a,b:5}")
+    assert template.segments == (
+        "smartylighting/",
+        ChannelExpression("", (ChannelVariable("streetlightId"),)),
+        "/lighting/",
+        ChannelExpression("+", (ChannelVariable("path", explode=True),)),
+        "/",
+        ChannelExpression("", (ChannelVariable("a"), ChannelVariable("b", prefix=5))),
+    )
+    assert template.parameters == ("streetlightId", "path", "a", "b")
+
+
+def test_parameters_are_not_repeated():
+    assert parse_channel_uri("{id}/{id}/{other}").parameters == ("id", "other")
+
+
+def test_percent_encoded_characters():
+    assert parse_channel_uri("a%2Fb/{a%41}").segments[0] == "a%2Fb/"
+
+
+def test_templates_are_cached():
+    assert parse_channel_uri("cached/{id}") is parse_channel_uri("cached/{id}")
+
+
+@pytest.mark.parametrize(
+    "uri, reason, position",
+    [
+        ("a b", "invalid character ' '", 1),
+        ("ab%zz", "invalid percent-encoding", 2),
+        ("a/{}", "expected a variable name", 3),
+        ("a/{b", "unterminated expression", 4),
+        ("a/{b!}", "invalid character '!' in expression", 4),
+        ("{a,}", "expected a variable name", 3),
+        ("{a:0}", "invalid character ':' in expression", 2),
+        ("a}", "invalid character '}'", 1),
+    ],
+)
+def test_error_positions(uri, reason, position):
+    with pytest.raises(ChannelUriError) as info:
+        parse_channel_uri(uri)
+    assert str(info.value) == f"invalid channel URI: {reason} at position {position}"
+
+
+def test_trailing_newline_is_rejected():
+    # The regular expression used before matched "$" before a trailing newline
+    with pytest.raises(ChannelUriError, match="position 6"):
+        parse_channel_uri("orders\n")
+
+
+def test_channel_keys_are_validated():
+    data = {"asyncapi": "2.3.0", "info": {"title": "t", "version": "1"}, "channels": {"a/{b": {}}}
+    with pytest.raises(ValidationError, match="unterminated expression at position 4"):
+        AsyncAPI.parse_obj(data)
+
+
+def test_long_invalid_expression():
+    uri = "{" + "a," * 100_000
+    with pytest.raises(ChannelUriError, match="expected a variable name"):
+        parse_channel_uri(uri)
@@ -0,0 +1,37 @@
+import json
+import os
+
+from asyncapi_schema_pydantic.v2_3_0 import AmqpChannelType, AsyncAPI, ChannelItem, Reference, SecuritySchemeLocation
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "data", "sample.yaml")
+
+CHANNEL = {
+    "parameters": {"orderId": {"schema": {"type": "string"}}},
+    "bindings": {"amqp": {"is": "queue", "queue": {"name": "orders"}}},
+    "subscribe": {"message": {"$ref": "#/components/messages/Order"}},
+}
+
+
+def test_construct_trusted_equals_parse_obj():
+    data = json.loads(AsyncAPI.load_from_file(SAMPLE).json(by_alias=True, exclude_unset=True))
+    assert AsyncAPI.construct_trusted(data) == AsyncAPI.parse_obj(data)
+
+
+def test_aliases_are_resolved():
+    channel = ChannelItem.construct_trusted(CHANNEL)
+    assert channel == ChannelItem.parse_obj(CHANNEL)
+    assert channel.parameters["orderId"].param_schema.type == "string"
+    assert channel.bindings.amqp.param_is is AmqpChannelType.queue
+    assert isinstance(channel.subscribe.message, Reference)
+    assert channel.subscribe.message.ref == "#/components/messages/Order"
+
+
+def test_security_scheme_location():
+    data = {
+        "asyncapi": "2.3.0",
+        "info": {"title": "t", "version": "1"},
+        "channels": {},
+        "components": {"securitySchemes": {"key": {"type": "httpApiKey", "name": "api_key", "in": "header"}}},
+    }
+    scheme = AsyncAPI.construct_trusted(data).components.securitySchemes["key"]
+    assert scheme.param_in is SecuritySchemeLocation.header
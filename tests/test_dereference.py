@@ -0,0 +1,55 @@
+import os
+
+from asyncapi_schema_pydantic.v2_3_0 import AsyncAPI, Reference, dereference
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "data", "sample.yaml")
+
+
+def test_references_become_the_shared_components():
+    document = AsyncAPI.load_from_file(SAMPLE, dereference_components=True)
+    message = document.channels["user/signedup"].publish.message
+    assert not isinstance(message, Reference)
+    assert message is document.components.messages["UserSignedUp"]
+
+
+def test_recursive_schemas_become_cycles():
+    document = AsyncAPI.parse_obj(
+        {
+            "asyncapi": "2.3.0",
+            "info": {"title": "t", "version": "1"},
+            "channels": {},
+            "components": {
+                "schemas": {
+                    "Node": {"type": "object", "properties": {"next": {"$ref": "#/components/schemas/Node"}}},
+                    "Alias": {"$ref": "#/components/schemas/Node"},
+                }
+            },
+        }
+    )
+    dereference(document)
+    schemas = document.components.schemas
+    assert schemas["Node"].properties["next"] is schemas["Node"]
+    assert schemas["Alias"] is schemas["Node"]
+
+
+def test_references_with_extensions_are_kept():
+    document = AsyncAPI.parse_obj(
+        {
+            "asyncapi": "2.3.0",
+            "info": {"title": "t", "version": "1"},
+            "channels": {},
+            "components": {
+                "schemas": {
+                    "Id": {"type": "string"},
+                    "Event": {
+                        "type": "object",
+                        "properties": {"took": {"$ref": "#/components/schemas/Id", "x-unit": "ms"}},
+                    },
+                }
+            },
+        }
+    )
+    dereference(document)
+    took = document.components.schemas["Event"].properties["took"]
+    assert took.ref == "#/components/schemas/Id"
+    assert took.extras == {"x-unit": "ms"}
@@ -0,0 +1,63 @@
+import json
+import os
+
+from asyncapi_schema_pydantic.v2_3_0 import AsyncAPI, FileCache, RefResolver
+
+
+def write(path, data):
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def counting_loader(calls):
+    def load(path):
+        calls.append(os.path.basename(path))
+        return AsyncAPI.load_data_from_file(path)
+
+    return load
+
+
+def test_each_file_is_parsed_once_per_load(tmp_path):
+    write(tmp_path / "order.yaml", {"type": "object"})
+    data = {"a": {"$ref": "order.yaml"}, "c": [{"$ref": "order.yaml"}]}
+    calls = []
+    resolved = RefResolver(str(tmp_path), counting_loader(calls)).resolve(data)
+    assert calls == ["order.yaml"]
+    assert resolved == {"a": {"type": "object"}, "c": [{"type": "object"}]}
+    assert resolved["a"] is resolved["c"][0]
+
+
+def test_input_is_not_modified(tmp_path):
+    write(tmp_path / "order.yaml", {"type": "object"})
+    data = {"a": {"$ref": "order.yaml"}}
+    RefResolver(str(tmp_path), AsyncAPI.load_data_from_file).resolve(data)
+    assert data == {"a": {"$ref": "order.yaml"}}
+
+
+def test_file_cache_is_reused_across_loads(tmp_path):
+    path = write(tmp_path / "order.yaml", {"type": "object"})
+    cache = FileCache()
+    calls = []
+    loader = counting_loader(calls)
+    assert cache.load(path, loader) == {"type": "object"}
+    assert cache.load(path, loader) == {"type": "object"}
+    assert calls == ["order.yaml"]
+    assert path in cache
+
+
+def test_file_cache_entries_are_invalidated_by_changes(tmp_path):
+    path = write(tmp_path / "order.yaml", {"type": "object"})
+    cache = FileCache()
+    cache.load(path, AsyncAPI.load_data_from_file)
+    write(tmp_path / "order.yaml", {"type": "object", "title": "Order"})
+    os.utime(path, ns=(0, 0))
+    assert cache.load(path, AsyncAPI.load_data_from_file) == {"type": "object", "title": "Order"}
+
+
+def test_file_cache_evicts_the_least_recently_used(tmp_path):
+    paths = [write(tmp_path / f"f{i}.yaml", {"n": i}) for i in range(3)]
+    cache = FileCache(maxsize=2)
+    for path in paths:
+        cache.load(path, AsyncAPI.load_data_from_file)
+    assert len(cache) == 2
+    assert paths[0] not in cache
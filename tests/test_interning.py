@@ -0,0 +1,30 @@
+import json
+
+from asyncapi_schema_pydantic import AsyncAPI
+
+
+def write_spec(tmp_path):
+    (tmp_path / "shared.json").write_text(json.dumps({"type": "object", "properties": {"id": {"type": "string"}}}))
+    channels = {f"c{i}": {"subscribe": {"message": {"payload": {"$ref": "shared.json"}}}} for i in range(3)}
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps({"asyncapi": "2.3.0", "info": {"title": "t", "version": "1"}, "channels": channels}))
+    return str(path)
+
+
+def payloads(async_api):
+    return [channel.subscribe.message.payload for channel in async_api.channels.values()]
+
+
+def test_repeated_references_share_one_instance(tmp_path):
+    path = write_spec(tmp_path)
+    first, *others = payloads(AsyncAPI.load_from_file(path, intern_references=True))
+    assert all(payload is first for payload in others)
+
+
+def test_interning_does_not_change_the_document(tmp_path):
+    path = write_spec(tmp_path)
+    interned = AsyncAPI.load_from_file(path, intern_references=True)
+    plain = AsyncAPI.load_from_file(path)
+    assert interned == plain
+    first, second, _ = payloads(plain)
+    assert first is not second
@@ -0,0 +1,29 @@
+from asyncapi_schema_pydantic.v2_3_0 import Schema
+from asyncapi_schema_pydantic.v2_3_0.json_schema import JsonSchemaObject
+
+
+def test_extras_are_kept():
+    schema = JsonSchemaObject.parse_obj({"type": "string", "x-unit": "ms"})
+    assert schema.extras == {"x-unit": "ms"}
+
+
+def test_extras_are_mutable_per_schema():
+    first = JsonSchemaObject.parse_obj({"type": "string"})
+    second = JsonSchemaObject.parse_obj({"type": "integer"})
+    first.extras["x-unit"] = "ms"
+    assert first.extras == {"x-unit": "ms"}
+    assert second.extras == {}
+
+
+def test_empty_extras_are_made_on_first_use():
+    schema = Schema.parse_obj({"type": "object", "properties": {"id": {"type": "string"}}})
+    node = schema.properties["id"]
+    assert "extras" not in node.__dict__
+    assert list(schema.dict()) == list(Schema.__fields__)
+    assert schema.dict(exclude_unset=True) == {
+        "type": "object",
+        "properties": {"id": {"type": "string", "extras": {}}},
+        "extras": {},
+    }
+    node.extras["x-unit"] = "ms"
+    assert schema.properties["id"].extras == {"x-unit": "ms"}
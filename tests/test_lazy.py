@@ -0,0 +1,58 @@
+from asyncapi_schema_pydantic import AsyncAPI
+from asyncapi_schema_pydantic.v2_3_0 import ChannelItem, LazyReference
+from asyncapi_schema_pydantic.v2_3_0.json_schema import JsonSchemaObject
+from asyncapi_schema_pydantic.v2_3_0.lazy import parse_lazily
+
+SPEC = {
+    "asyncapi": "2.3.0",
+    "info": {"title": "Lazy", "version": "1"},
+    "channels": {
+        "orders": {
+            "subscribe": {
+                "message": {
+                    "payload": {"$ref": "#/components/schemas/Order"},
+                    "headers": {"$ref": "#/components/schemas/Headers"},
+                }
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "Order": {
+                "type": "object",
+                "properties": {
+                    "id": {"$ref": "#/components/schemas/Id"},
+                    "other_id": {"$ref": "#/components/schemas/Id", "description": "Not only a reference"},
+                },
+            },
+            "Id": {"type": "string"},
+            "Headers": {"type": "object"},
+        }
+    },
+}
+
+
+def test_schema_references_are_lazy():
+    async_api = parse_lazily(AsyncAPI, SPEC)
+    message = async_api.channels["orders"].subscribe.message
+    assert isinstance(message.payload, LazyReference)
+    assert message.payload.resolve() is async_api.components.schemas["Order"]
+    assert message.payload.type == "object"
+    assert message.headers.type == "object"
+    assert isinstance(message.payload.properties["id"], LazyReference)
+    assert message.payload.properties["id"].type == "string"
+    # Schemas with other keywords than $ref are kept as they are
+    assert isinstance(message.payload.properties["other_id"], JsonSchemaObject)
+
+
+def test_schema_proxies_serialize_as_their_reference():
+    async_api = parse_lazily(AsyncAPI, SPEC)
+    message = async_api.channels["orders"].subscribe.message.dict(by_alias=True, exclude_none=True)
+    assert message["payload"] == {"$ref": "#/components/schemas/Order"}
+
+
+def test_lazy_channels_are_validated_when_copied():
+    async_api = parse_lazily(AsyncAPI, SPEC, references=False, channels=True)
+    for copy in (dict(async_api.channels), {**async_api.channels}, async_api.channels.copy()):
+        assert isinstance(copy["orders"], ChannelItem)
+    assert async_api.channels.validated == {"orders"}
@@ -0,0 +1,34 @@
+import io
+import os
+
+from asyncapi_schema_pydantic.v2_3_0 import AsyncAPI
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "data", "sample.yaml")
+
+SPEC = (
+    "asyncapi: 2.3.0\ninfo:\n  title: t\n  version: '1'\n"
+    "channels:\n  a:\n    publish:\n      message:\n        $ref: message.yaml\n"
+)
+
+
+def test_bytes_string_and_stream_match_the_file():
+    expected = AsyncAPI.load_from_file(SAMPLE)
+    with open(SAMPLE, "rb") as f:
+        content = f.read()
+    assert AsyncAPI.load_from_bytes(content) == expected
+    assert AsyncAPI.load_from_string(content.decode("utf-8")) == expected
+    assert AsyncAPI.load_from_stream(io.BytesIO(content)) == expected
+
+
+def test_references_are_relative_to_base_path(tmp_path):
+    (tmp_path / "message.yaml").write_text("name: external\n")
+    document = AsyncAPI.load_from_string(SPEC, base_path=str(tmp_path))
+    assert document.channels["a"].publish.message.name == "external"
+
+
+def test_references_are_relative_to_the_stream_file(tmp_path):
+    (tmp_path / "message.yaml").write_text("name: external\n")
+    (tmp_path / "spec.yaml").write_text(SPEC)
+    with open(tmp_path / "spec.yaml", "rb") as f:
+        document = AsyncAPI.load_from_stream(f)
+    assert document.channels["a"].publish.message.name == "external"
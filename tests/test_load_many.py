@@ -0,0 +1,39 @@
+import os
+import shutil
+
+from asyncapi_schema_pydantic.v2_3_0 import AsyncAPI
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "data", "sample.yaml")
+
+
+def make_files(tmp_path):
+    valid = [str(shutil.copy(SAMPLE, tmp_path / f"spec{i}.yaml")) for i in range(3)]
+    invalid = tmp_path / "invalid.yaml"
+    invalid.write_text("asyncapi: 2.3.0\ninfo:\n  title: t\n")
+    return valid + [str(invalid), str(tmp_path / "missing.yaml")]
+
+
+def check(results, paths):
+    assert [result.path for result in results] == paths
+    assert [result.ok for result in results] == [True, True, True, False, False]
+    assert results[0].document == AsyncAPI.load_from_file(SAMPLE)
+    assert results[3].error.type == "ValidationError"
+    assert results[3].error.errors[0]["loc"] == ("info", "version")
+    assert results[4].error.type == "FileNotFoundError"
+
+
+def test_load_many_in_process(tmp_path):
+    paths = make_files(tmp_path)
+    check(AsyncAPI.load_many(paths, workers=1), paths)
+
+
+def test_load_many_on_a_process_pool(tmp_path):
+    paths = make_files(tmp_path)
+    check(AsyncAPI.load_many(paths, workers=2), paths)
+
+
+def test_without_documents(tmp_path):
+    paths = make_files(tmp_path)
+    results = AsyncAPI.load_many(paths, workers=1, keep_documents=False)
+    assert all(result.document is None for result in results)
+    assert [result.ok for result in results] == [True, True, True, False, False]
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from asyncapi_schema_pydantic.v2_3_0 import AsyncAPI
+from asyncapi_schema_pydantic.v2_3_0 import loaders
+
+
+def write(path, content):
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_yaml_file(tmp_path):
+    path = write(tmp_path / "spec.yaml", b"asyncapi: 2.3.0\ninfo:\n  title: t\n  version: '1'\n")
+    assert AsyncAPI.load_data_from_file(path) == {"asyncapi": "2.3.0", "info": {"title": "t", "version": "1"}}
+
+
+def test_json_file(tmp_path):
+    path = write(tmp_path / "spec.json", json.dumps({"info": {"title": "t"}}).encode())
+    assert AsyncAPI.load_data_from_file(path) == {"info": {"title": "t"}}
+
+
+def test_yaml_flow_mapping_falls_back_to_the_yaml_loader(tmp_path):
+    # Looks like JSON, but isn't
+    path = write(tmp_path / "spec.yaml", b"{a: 1, b: [x, y]}")
+    assert AsyncAPI.load_data_from_file(path) == {"a": 1, "b": ["x", "y"]}
+
+
+def test_json_values_that_yaml_would_change(tmp_path):
+    path = write(tmp_path / "spec.yaml", b'{"version": 1.10, "on": "yes"}')
+    assert AsyncAPI.load_data_from_file(path) == {"version": 1.1, "on": "yes"}
+
+
+def test_yaml_file_holding_json():
+    calls = []
+
+    def load_json(content):
+        calls.append(content)
+        return json.loads(content)
+
+    document_loaders = loaders.DocumentLoaders(default=loaders.load_yaml)
+    document_loaders.register(load_json, (".json",), sniff=loaders.looks_like_json)
+    document_loaders.register(loaders.load_yaml, (".yaml",))
+    assert document_loaders.load(b' {"a": [1, 2]}', "spec.yaml") == {"a": [1, 2]}
+    assert len(calls) == 1
+
+
+def test_large_files_are_mapped_in_memory(tmp_path, monkeypatch):
+    monkeypatch.setattr(loaders, "MMAP_THRESHOLD", 16)
+    path = tmp_path / "spec.yaml"
+    path.write_text("asyncapi: 2.3.0\ninfo:\n  title: " + "t" * 100 + "\n")
+    assert AsyncAPI.load_data_from_file(str(path))["info"]["title"] == "t" * 100
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps({"info": {"title": "t" * 100}}))
+    assert AsyncAPI.load_data_from_file(str(path))["info"]["title"] == "t" * 100
+
+
+def test_registered_loader_is_used_for_its_extension(tmp_path):
+    document_loaders = loaders.DocumentLoaders(default=loaders.load_yaml)
+    document_loaders.register(lambda content: {"lines": bytes(content).decode().split()}, (".TXT",))
+    assert document_loaders.extensions == (".txt",)
+    path = tmp_path / "spec.txt"
+    path.write_text("a b\nc\n")
+    assert document_loaders.load_file(str(path)) == {"lines": ["a", "b", "c"]}
+    assert document_loaders.load(b"a: 1", "spec.yaml") == {"a": 1}
+
+
+def test_no_loader():
+    document_loaders = loaders.DocumentLoaders()
+    with pytest.raises(ValueError, match="No loader for spec.txt"):
+        document_loaders.load(b"a", "spec.txt")
@@ -0,0 +1,61 @@
+import pytest
+from pydantic import ValidationError
+
+from asyncapi_schema_pydantic.v2_3_0 import (
+    AsyncAPI,
+    ChannelBindings,
+    KafkaChannelBinding,
+    SubtreeMemo,
+    validating_protocols,
+)
+
+SPEC = {
+    "asyncapi": "2.3.0",
+    "info": {"title": "Protocols", "version": "1"},
+    "servers": {"broker": {"url": "kafka.example.com", "protocol": "kafka", "bindings": {"mqtt": {"unknown": 1}}}},
+    "channels": {
+        "orders": {
+            "bindings": {"kafka": {}, "amqp": {"is": "queue", "unknown": True}},
+            "subscribe": {"message": {"bindings": {"http": {"headers": 5}}}},
+        }
+    },
+}
+
+
+def test_bindings_of_other_protocols_are_kept_raw():
+    async_api = AsyncAPI.parse_data(SPEC, protocols={"kafka"})
+    bindings = async_api.channels["orders"].bindings
+    assert isinstance(bindings.kafka, KafkaChannelBinding)
+    assert bindings.amqp == {"is": "queue", "unknown": True}
+    assert async_api.servers["broker"].bindings.mqtt == {"unknown": 1}
+    assert async_api.channels["orders"].subscribe.message.bindings.http == {"headers": 5}
+    assert async_api.dict(by_alias=True, exclude_none=True)["channels"]["orders"]["bindings"]["amqp"]["is"] == "queue"
+
+
+def test_every_protocol_is_validated_by_default():
+    with pytest.raises(ValidationError):
+        AsyncAPI.parse_data(SPEC)
+
+
+@pytest.mark.parametrize("options", [{"lazy_channels": True}, {"lazy_references": True}, {"intern_references": True}])
+def test_other_loading_options(options):
+    async_api = AsyncAPI.parse_data(SPEC, protocols=["kafka"], **options)
+    assert async_api.channels["orders"].bindings.amqp == {"is": "queue", "unknown": True}
+
+
+def test_memo_keeps_selections_apart():
+    with SubtreeMemo():
+        AsyncAPI.parse_data(SPEC, protocols=["kafka"])
+        with pytest.raises(ValidationError):
+            AsyncAPI.parse_data(SPEC)
+
+
+def test_context_manager():
+    with validating_protocols(["amqp"]):
+        bindings = ChannelBindings.parse_obj({"kafka": {"unknown": 1}})
+    assert bindings.kafka == {"unknown": 1}
+
+
+def test_unknown_protocol():
+    with pytest.raises(ValueError, match="Unknown protocols: kafak"):
+        AsyncAPI.parse_data(SPEC, protocols=["kafak"])
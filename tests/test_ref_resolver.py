@@ -0,0 +1,217 @@
+import json
+import os
+
+import pytest
+
+from asyncapi_schema_pydantic.v2_3_0 import (
+    AsyncAPI,
+    RefBudgetExceededError,
+    RefCycleError,
+    RefResolutionError,
+    RefResolver,
+    ResolutionLimits,
+)
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def resolver(folder, **kwargs):
+    return RefResolver(str(folder), AsyncAPI.load_data_from_file, **kwargs)
+
+
+def test_external_ref_replaces_the_whole_node(tmp_path):
+    write(tmp_path / "order.yaml", {"type": "object"})
+    data = {"payload": {"$ref": "order.yaml", "description": "Ignored"}}
+    assert resolver(tmp_path).resolve(data) == {"payload": {"type": "object"}}
+
+
+def test_prefetching_resolves_like_the_serial_resolver(tmp_path):
+    write(tmp_path / "common.yaml", {"type": "string"})
+    for i in range(20):
+        write(tmp_path / f"event{i}.yaml", {"properties": {"id": {"$ref": "common.yaml"}, "n": i}})
+    data = {"channels": {f"c{i}": {"payload": {"$ref": f"event{i}.yaml"}} for i in range(20)}}
+    serial = resolver(tmp_path).resolve_document(data)
+    concurrent = resolver(tmp_path, max_workers=4)
+    assert concurrent.resolve_document(data) == serial
+    assert len(concurrent.documents) == 21
+
+
+def test_pointer_fragments(tmp_path):
+    write(tmp_path / "schemas.json", {"Order": {"type": "object"}, "a/b": {"tags": ["x", "y"]}})
+    data = {
+        "order": {"$ref": "schemas.json#/Order"},
+        "escaped": {"$ref": "schemas.json#/a~1b/tags/1"},
+        "whole": {"$ref": "schemas.json"},
+    }
+    resolved = resolver(tmp_path).resolve_document(data)
+    assert resolved["order"] == {"type": "object"}
+    assert resolved["escaped"] == "y"
+    assert resolved["whole"]["Order"] is resolved["order"]
+
+
+def test_escaped_pointers_are_distinct_nodes(tmp_path):
+    write(tmp_path / "lib.json", {"a/b": {"type": "string"}, "a": {"b": {"type": "integer"}, "": {"type": "null"}}})
+    data = {
+        "escaped": {"$ref": "lib.json#/a~1b"},
+        "nested": {"$ref": "lib.json#/a/b"},
+        "empty_name": {"$ref": "lib.json#/a/"},
+        "a": {"$ref": "lib.json#/a"},
+    }
+    resolved = resolver(tmp_path).resolve_document(data)
+    assert resolved["escaped"] == {"type": "string"}
+    assert resolved["nested"] == {"type": "integer"}
+    assert resolved["empty_name"] == {"type": "null"}
+    assert resolved["a"] == {"b": {"type": "integer"}, "": {"type": "null"}}
+
+
+def test_invalid_pointer(tmp_path):
+    write(tmp_path / "lib.json", {"Order": {}})
+    with pytest.raises(RefResolutionError, match="Invalid JSON pointer 'Order'"):
+        resolver(tmp_path).resolve_document({"$ref": "lib.json#Order"})
+
+
+def test_refs_are_relative_to_the_file_holding_them(tmp_path):
+    write(tmp_path / "shared" / "money.json", {"type": "number"})
+    write(
+        tmp_path / "shared" / "schemas.json",
+        {
+            "Order": {
+                "type": "object",
+                "properties": {
+                    "total": {"$ref": "money.json"},
+                    "address": {"$ref": "#/Address"},
+                    "customer": {"$ref": "#/components/schemas/Customer"},
+                },
+            },
+            "Address": {"type": "string"},
+        },
+    )
+    data = {"payload": {"$ref": "../shared/schemas.json#/Order"}}
+    resolved = resolver(tmp_path / "sub").resolve_document(data)
+    assert resolved["payload"]["properties"] == {
+        "total": {"type": "number"},
+        "address": {"type": "string"},
+        # Not a node of schemas.json: kept, pointing into the root document
+        "customer": {"$ref": "#/components/schemas/Customer"},
+    }
+
+
+def test_refs_of_prefetched_files_are_relative_to_them(tmp_path):
+    write(tmp_path / "shared" / "money.json", {"type": "number"})
+    write(tmp_path / "shared" / "schemas.json", {"Order": {"properties": {"total": {"$ref": "money.json"}}}})
+    data = {"payload": {"$ref": "../shared/schemas.json#/Order"}}
+    resolved = resolver(tmp_path / "sub", max_workers=2).resolve_document(data)
+    assert resolved["payload"]["properties"]["total"] == {"type": "number"}
+
+
+def test_local_refs_of_the_root_document_are_kept(tmp_path):
+    data = {"payload": {"$ref": "#/components/schemas/Order"}}
+    assert resolver(tmp_path).resolve_document(data) == data
+
+
+def test_cycle_is_reported(tmp_path):
+    write(tmp_path / "a.json", {"next": {"$ref": "b.json"}})
+    write(tmp_path / "b.json", {"next": {"$ref": "a.json"}})
+    with pytest.raises(RefCycleError) as info:
+        resolver(tmp_path).resolve_document({"$ref": "a.json"})
+    assert info.value.cycle == ["a.json", "b.json", "a.json"]
+
+
+def test_recursive_local_refs_are_kept(tmp_path):
+    write(tmp_path / "tree.json", {"Node": {"children": {"items": {"$ref": "#/Node"}}}})
+    write(tmp_path / "node.yaml", {"type": "array", "items": {"$ref": "#"}})
+    data = {"tree": {"$ref": "tree.json#/Node"}, "node": {"$ref": "node.yaml"}}
+    resolved = resolver(tmp_path).resolve_document(data)
+    assert resolved["tree"] == {"children": {"items": {"$ref": "#/Node"}}}
+    assert resolved["node"] == {"type": "array", "items": {"$ref": "#"}}
+
+
+def test_local_refs_aliasing_each_other_are_a_cycle(tmp_path):
+    write(tmp_path / "lib.json", {"A": {"$ref": "#/B"}, "B": {"$ref": "#/A"}})
+    with pytest.raises(RefCycleError) as info:
+        resolver(tmp_path).resolve_document({"$ref": "lib.json#/A"})
+    assert info.value.cycle == ["lib.json#/A", "#/B", "#/A"]
+
+
+def test_cycle_through_a_local_ref_is_reported(tmp_path):
+    write(tmp_path / "a.json", {"A": {"next": {"$ref": "b.json"}}, "root": {"$ref": "#/A"}})
+    write(tmp_path / "b.json", {"next": {"$ref": "a.json#/root"}})
+    with pytest.raises(RefCycleError) as info:
+        resolver(tmp_path).resolve_document({"$ref": "a.json#/root"})
+    assert info.value.cycle == ["a.json#/root", "#/A", "b.json", "a.json#/root"]
+
+
+def test_shared_reference_is_not_a_cycle(tmp_path):
+    write(tmp_path / "leaf.json", {"type": "string"})
+    write(tmp_path / "pair.json", {"first": {"$ref": "leaf.json"}, "second": {"$ref": "leaf.json"}})
+    resolved = resolver(tmp_path).resolve_document({"$ref": "pair.json"})
+    assert resolved["first"] is resolved["second"]
+
+
+def test_missing_pointer(tmp_path):
+    write(tmp_path / "schemas.json", {"Order": {}})
+    with pytest.raises(RefResolutionError, match="'Missing' not found"):
+        resolver(tmp_path).resolve_document({"$ref": "schemas.json#/Missing"})
+
+
+def test_max_depth(tmp_path):
+    for i in range(4):
+        write(tmp_path / f"f{i}.json", {"next": {"$ref": f"f{i + 1}.json"}})
+    write(tmp_path / "f4.json", {})
+    data = {"$ref": "f0.json"}
+    resolver(tmp_path, limits=ResolutionLimits(max_depth=5)).resolve_document(data)
+    with pytest.raises(RefBudgetExceededError, match="nesting deeper than 4"):
+        resolver(tmp_path, limits=ResolutionLimits(max_depth=4)).resolve_document(data)
+
+
+def test_max_nodes_counts_every_inclusion(tmp_path):
+    write(tmp_path / "leaf.json", {"a": 1, "b": 2})
+    data = [{"$ref": "leaf.json"} for _ in range(10)]
+    resolver(tmp_path, limits=ResolutionLimits(max_nodes=30)).resolve_document(data)
+    with pytest.raises(RefBudgetExceededError, match="More than 29 nodes"):
+        resolver(tmp_path, limits=ResolutionLimits(max_nodes=29)).resolve_document(data)
+
+
+def test_max_bytes(tmp_path):
+    path = write(tmp_path / "big.json", {"description": "x" * 1000})
+    size = os.path.getsize(path)
+    resolver(tmp_path, limits=ResolutionLimits(max_bytes=size)).resolve_document({"$ref": "big.json"})
+    with pytest.raises(RefBudgetExceededError, match="bytes read"):
+        resolver(tmp_path, limits=ResolutionLimits(max_bytes=size - 1)).resolve_document({"$ref": "big.json"})
+
+
+def test_failed_resolution_leaves_the_resolver_usable(tmp_path):
+    write(tmp_path / "a.json", {"next": {"$ref": "a.json"}})
+    write(tmp_path / "leaf.json", {"type": "string"})
+    ref_resolver = resolver(tmp_path)
+    with pytest.raises(RefCycleError):
+        ref_resolver.resolve_document({"$ref": "a.json"})
+    assert ref_resolver.resolve_document({"x": {"$ref": "leaf.json"}}) == {"x": {"type": "string"}}
+
+
+def test_deep_documents_are_resolved_without_recursion(tmp_path):
+    write(tmp_path / "leaf.json", {"type": "string"})
+    schema = {"$ref": "leaf.json"}
+    for _ in range(3000):
+        schema = {"type": "array", "items": schema}
+    resolved = resolver(tmp_path).resolve_document({"payload": schema})["payload"]
+    for _ in range(3000):
+        resolved = resolved["items"]
+    assert resolved == {"type": "string"}
+
+
+def test_deep_schemas_load_from_data():
+    schema = {"type": "string"}
+    for _ in range(1200):
+        schema = {"type": "array", "items": schema}
+    data = {
+        "asyncapi": "2.3.0",
+        "info": {"title": "Deep", "version": "1"},
+        "channels": {"deep": {"subscribe": {"message": {"payload": schema}}}},
+    }
+    async_api = AsyncAPI.load_from_data(data)
+    assert async_api.channels["deep"].subscribe.message.payload.type == "array"
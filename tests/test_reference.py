@@ -0,0 +1,43 @@
+import pytest
+from pydantic import ValidationError
+
+from asyncapi_schema_pydantic.v2_3_0 import Message, Operation, OperationBindings, OperationTrait, Reference
+
+
+def test_mapping_with_ref_is_a_reference():
+    operation = Operation.parse_obj({"message": {"$ref": "#/components/messages/Order"}})
+    assert isinstance(operation.message, Reference)
+    assert operation.message.ref == "#/components/messages/Order"
+
+
+def test_mapping_without_ref_is_the_model():
+    operation = Operation.parse_obj({"message": {"name": "Order"}, "bindings": {"kafka": {}}})
+    assert isinstance(operation.message, Message)
+    assert isinstance(operation.bindings, OperationBindings)
+
+
+def test_items_are_dispatched():
+    operation = Operation.parse_obj({"traits": [{"$ref": "#/components/operationTraits/Common"}, {"summary": "s"}]})
+    reference, trait = operation.traits
+    assert isinstance(reference, Reference)
+    assert isinstance(trait, OperationTrait)
+
+
+def test_invalid_model_errors_are_not_hidden_by_reference():
+    with pytest.raises(ValidationError) as info:
+        Operation.parse_obj({"message": {"name": "Order", "unknown": 1}})
+    # Only the errors of Message: the mapping is not also tried as a Reference
+    assert [error["loc"] for error in info.value.errors()] == [("message", "unknown")]
+
+
+def test_invalid_reference():
+    with pytest.raises(ValidationError) as info:
+        Operation.parse_obj({"message": {"$ref": "#/components/messages/Order", "name": "Order"}})
+    assert [error["loc"] for error in info.value.errors()] == [("message", "name")]
+
+
+def test_instances_are_accepted():
+    message = Message.parse_obj({"name": "Order"})
+    reference = Reference.parse_obj({"$ref": "#/components/messages/Order"})
+    assert Operation(message=message).message == message
+    assert Operation(message=reference).message == reference
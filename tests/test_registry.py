@@ -0,0 +1,53 @@
+import os
+import time
+
+from asyncapi_schema_pydantic.v2_3_0 import AsyncAPI, SpecRegistry
+
+SPEC = "asyncapi: 2.3.0\ninfo:\n  title: {title}\n  version: '1'\nchannels: {{}}\n"
+
+
+def write(path, text):
+    path.write_text(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_refresh(tmp_path):
+    path = tmp_path / "spec.yaml"
+    write(path, SPEC.format(title="first"))
+    errors = []
+    registry = SpecRegistry(AsyncAPI, on_error=lambda name, error: errors.append(name))
+    registry.add("spec", str(path))
+    assert list(registry) == ["spec"]
+    assert registry.refresh() == []
+
+    write(path, SPEC.format(title="second"))
+    assert registry.refresh() == ["spec"]
+    assert registry["spec"].info.title == "second"
+
+    # A failing reload keeps the previous document and is not retried until the file changes
+    write(path, "asyncapi: 2.3.0\n")
+    assert registry.refresh() == []
+    assert registry.refresh() == []
+    assert registry["spec"].info.title == "second"
+    assert errors == ["spec"]
+    assert "spec" in registry.errors
+
+    write(path, SPEC.format(title="third"))
+    assert registry.refresh() == ["spec"]
+    assert registry.errors == {}
+
+    registry.remove("spec")
+    assert "spec" not in registry and len(registry) == 0
+
+
+def test_background_thread(tmp_path):
+    path = tmp_path / "spec.yaml"
+    write(path, SPEC.format(title="first"))
+    with SpecRegistry(AsyncAPI, poll_interval=0.01, debounce=0.01) as registry:
+        registry.add("spec", str(path))
+        write(path, SPEC.format(title="second"))
+        deadline = time.monotonic() + 10
+        while registry["spec"].info.title != "second" and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert registry["spec"].info.title == "second"
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from asyncapi_schema_pydantic.v2_3_0 import AsyncAPI
+
+SPEC = """asyncapi: 2.3.0
+info:
+  title: t
+  version: '1'
+channels:
+  a:
+    publish:
+      message:
+        $ref: message.yaml
+  b:
+    publish:
+      message:
+        name: b
+components:
+  schemas:
+    S:
+      type: string
+"""
+
+
+def write(path, text):
+    path.write_text(text)
+    # Make the change visible even within the resolution of the file system timestamps
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def spec(tmp_path):
+    write(tmp_path / "message.yaml", "name: a\n")
+    write(tmp_path / "spec.yaml", SPEC)
+    return tmp_path
+
+
+def test_unchanged_files_are_not_reloaded(spec):
+    handle = AsyncAPI.load_reloadable(str(spec / "spec.yaml"))
+    document = handle.document
+    assert handle.reload() is document
+    assert handle.revalidated == []
+
+
+def test_only_the_units_referencing_a_changed_file_are_revalidated(spec):
+    handle = AsyncAPI.load_reloadable(str(spec / "spec.yaml"))
+    previous = handle.document
+    write(spec / "message.yaml", "name: changed\n")
+    document = handle.reload()
+    assert handle.revalidated == ["#/channels/a"]
+    assert document.channels["a"].publish.message.name == "changed"
+    assert document.channels["b"] is previous.channels["b"]
+    assert document.components.schemas["S"] is previous.components.schemas["S"]
+    assert document == AsyncAPI.load_from_file(str(spec / "spec.yaml"))
+
+
+def test_a_failed_reload_keeps_the_previous_document(spec):
+    handle = AsyncAPI.load_reloadable(str(spec / "spec.yaml"))
+    previous = handle.document
+    write(spec / "message.yaml", "name: [not, a, string]\n")
+    with pytest.raises(ValidationError):
+        handle.reload()
+    assert handle.document is previous
+
+
+@pytest.mark.parametrize("channels", ["channels: not-a-mapping\n", "channels: [[a, {}]]\n"])
+def test_documents_without_the_unit_layout_are_rejected(spec, channels):
+    handle = AsyncAPI.load_reloadable(str(spec / "spec.yaml"))
+    previous = handle.document
+    write(spec / "spec.yaml", "asyncapi: 2.3.0\ninfo:\n  title: t\n  version: '1'\n" + channels)
+    with pytest.raises(ValidationError):
+        handle.reload()
+    assert handle.document is previous
+    assert handle.changed_files() == {str(spec / "spec.yaml")}
@@ -0,0 +1,88 @@
+import copy
+import os
+
+import pytest
+
+from asyncapi_schema_pydantic.v2_3_0 import AsyncAPI, select_channels
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "data", "sample.yaml")
+
+SPEC = {
+    "asyncapi": "2.3.0",
+    "info": {"title": "Selection", "version": "1"},
+    "servers": {"production": {"url": "kafka.example.com", "protocol": "kafka", "security": {"r": {"apiKey": []}}}},
+    "channels": {
+        "orders/created": {"subscribe": {"message": {"$ref": "#/components/messages/OrderCreated"}}},
+        "orders/alias": {"$ref": "#/channels/orders~1created"},
+        "users/signedup": {"subscribe": {"message": {"$ref": "#/components/messages/UserSignedUp"}}},
+    },
+    "components": {
+        "messages": {
+            "OrderCreated": {"payload": {"$ref": "#/components/schemas/Order"}},
+            "UserSignedUp": {"payload": {"$ref": "#/components/schemas/User"}},
+        },
+        "schemas": {
+            "Order": {"type": "object", "properties": {"customer": {"$ref": "#/components/schemas/User"}}},
+            "User": {"type": "object"},
+            "Unused": {"type": "object"},
+        },
+        "securitySchemes": {
+            "apiKey": {"type": "httpApiKey", "name": "api_key", "in": "header"},
+            "unused": {"type": "httpApiKey", "name": "other", "in": "header"},
+        },
+    },
+}
+
+
+def select(predicate):
+    return select_channels(SPEC, predicate)
+
+
+def test_referenced_components_are_kept_transitively():
+    selection = select(lambda uri, item: uri == "orders/created")
+    assert list(selection["channels"]) == ["orders/created"]
+    assert list(selection["components"]["messages"]) == ["OrderCreated"]
+    assert list(selection["components"]["schemas"]) == ["Order", "User"]
+
+
+def test_referenced_channels_are_kept():
+    selection = select(lambda uri, item: uri == "orders/alias")
+    assert list(selection["channels"]) == ["orders/created", "orders/alias"]
+    assert list(selection["components"]["messages"]) == ["OrderCreated"]
+
+
+def test_security_schemes_of_servers_are_kept():
+    selection = select(lambda uri, item: False)
+    assert selection["channels"] == {}
+    assert list(selection["components"]["securitySchemes"]) == ["apiKey"]
+    assert selection["servers"] == SPEC["servers"]
+
+
+def test_predicate_receives_raw_data():
+    seen = {}
+
+    def predicate(uri, item):
+        seen[uri] = item
+        return False
+
+    select(predicate)
+    assert seen == SPEC["channels"]
+
+
+def test_data_is_not_modified():
+    original = copy.deepcopy(SPEC)
+    select(lambda uri, item: uri.startswith("users/"))
+    assert SPEC == original
+
+
+def test_selected_document_matches_the_full_one():
+    full = AsyncAPI.parse_data(SPEC)
+    selected = AsyncAPI.parse_data(SPEC, channels=lambda uri, item: uri.startswith("users/"))
+    assert list(selected.channels) == ["users/signedup"]
+    assert selected.channels["users/signedup"] == full.channels["users/signedup"]
+    assert selected.components.schemas == {"User": full.components.schemas["User"]}
+
+
+def test_selection_is_not_cached(tmp_path):
+    with pytest.raises(ValueError, match="cache_dir"):
+        AsyncAPI.load_from_file(SAMPLE, cache_dir=str(tmp_path), channels=lambda uri, item: True)
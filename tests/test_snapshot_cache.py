@@ -0,0 +1,37 @@
+import os
+
+from asyncapi_schema_pydantic import AsyncAPI
+from asyncapi_schema_pydantic.v2_3_0 import LazyModelDict
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "data", "sample.yaml")
+
+
+def test_snapshot_is_reused(tmp_path):
+    first = AsyncAPI.load_from_file(SAMPLE, cache_dir=str(tmp_path))
+    second = AsyncAPI.load_from_file(SAMPLE, cache_dir=str(tmp_path))
+    assert second == first
+    assert len(list(tmp_path.glob("*.snapshot"))) == 1
+
+
+def test_snapshot_is_rebuilt_when_a_file_changes(tmp_path):
+    path = tmp_path / "spec.yaml"
+    with open(SAMPLE) as f:
+        path.write_text(f.read())
+    cache_dir = str(tmp_path / "cache")
+    AsyncAPI.load_from_file(str(path), cache_dir=cache_dir)
+    path.write_text(path.read_text().replace("Email Service", "Mail Service"))
+    assert AsyncAPI.load_from_file(str(path), cache_dir=cache_dir).info.title == "Mail Service"
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_snapshots_are_kept_per_loading_options(tmp_path):
+    eager = AsyncAPI.load_from_file(SAMPLE, cache_dir=str(tmp_path))
+    lazy = AsyncAPI.load_from_file(SAMPLE, cache_dir=str(tmp_path), lazy_references=True)
+    assert not isinstance(eager.components.messages, LazyModelDict)
+    assert isinstance(lazy.components.messages, LazyModelDict)
+
+    eager = AsyncAPI.load_from_file(SAMPLE, cache_dir=str(tmp_path))
+    assert not isinstance(eager.components.messages, LazyModelDict)
+    lazy_channels = AsyncAPI.load_from_file(SAMPLE, cache_dir=str(tmp_path), lazy_channels=True)
+    assert isinstance(lazy_channels.channels, LazyModelDict)
+    assert len(list(tmp_path.glob("*.snapshot"))) == 3
@@ -0,0 +1,66 @@
+import gc
+import os
+import warnings
+
+from asyncapi_schema_pydantic import AsyncAPI
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "data", "sample.yaml")
+
+ANCHORED_SPEC = """\
+asyncapi: 2.3.0
+info:
+  title: Anchors
+  version: '1'
+components:
+  schemas:
+    Order: &order
+      type: object
+      properties:
+        id:
+          type: string
+channels:
+  orders:
+    subscribe:
+      message:
+        payload: *order
+  refunds:
+    subscribe:
+      message:
+        payload: *order
+"""
+
+
+def write_spec(tmp_path, content):
+    path = tmp_path / "spec.yaml"
+    path.write_text(content)
+    return str(path)
+
+
+def test_iter_channels_matches_load_from_file():
+    async_api = AsyncAPI.load_from_file(SAMPLE)
+    channels = dict(AsyncAPI.iter_channels_from_file(SAMPLE))
+    assert list(channels) == list(async_api.channels)
+
+
+def test_iter_channels_aliases_anchors_of_skipped_values(tmp_path):
+    path = write_spec(tmp_path, ANCHORED_SPEC)
+    expected = AsyncAPI.load_from_file(path)
+    channels = dict(AsyncAPI.iter_channels_from_file(path))
+    assert list(channels) == ["orders", "refunds"]
+    for channel_uri, channel in channels.items():
+        payload = channel.subscribe.message.payload
+        assert payload == expected.channels[channel_uri].subscribe.message.payload
+        assert payload.properties["id"].type == "string"
+
+
+def test_iter_channels_closes_the_file():
+    path = SAMPLE
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+        for _ in AsyncAPI.iter_channels_from_file(path):
+            pass
+        iterator = AsyncAPI.iter_channels_from_file(path)
+        next(iterator)
+        iterator.close()
+        gc.collect()
+    assert not [warning for warning in caught if issubclass(warning.category, ResourceWarning)]
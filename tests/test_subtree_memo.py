@@ -0,0 +1,42 @@
+import pytest
+from pydantic import ValidationError
+
+from asyncapi_schema_pydantic.v2_3_0 import Message, SubtreeMemo
+
+
+def envelope():
+    return {"type": "object", "properties": {"page": {"type": "integer"}, "size": {"type": "integer"}}}
+
+
+def test_identical_subtrees_share_an_instance():
+    data = {"payload": {"type": "object", "properties": {"first": envelope(), "second": envelope()}}}
+    with SubtreeMemo() as memo:
+        message = Message.parse_obj(data)
+    properties = message.payload.properties
+    assert properties["first"] is properties["second"]
+    assert memo.hits > 0
+    assert message == Message.parse_obj(data)
+
+
+def test_different_subtrees_are_kept_apart():
+    other = envelope()
+    other["properties"]["size"]["type"] = "string"
+    data = {"payload": {"type": "object", "properties": {"first": envelope(), "second": other}}}
+    with SubtreeMemo():
+        message = Message.parse_obj(data)
+    assert message.payload.properties["first"] != message.payload.properties["second"]
+
+
+def test_digest_of_a_subtree_containing_itself():
+    schema = {"type": "object"}
+    schema["properties"] = {"child": schema}
+    memo = SubtreeMemo()
+    assert memo.digest(schema) is None
+    assert memo.digest({"properties": {"child": {"type": "object"}}}) is not None
+
+
+def test_recursive_schema_is_rejected_with_a_memo():
+    schema = {"type": "object"}
+    schema["properties"] = {"child": schema}
+    with SubtreeMemo(), pytest.raises(ValidationError, match="Recursive schema"):
+        Message.parse_obj({"payload": schema})